@@ -0,0 +1,25 @@
+"""Shared JSON helpers for PRD and workspace files.
+
+Prefer orjson (Rust) when available - it parses/serializes severalfold
+faster than the stdlib and works in bytes directly, skipping a UTF-8
+decode on read and an encode on write - falling back transparently to
+stdlib json.
+"""
+
+try:
+    import orjson
+
+    def loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
@@ -1,10 +1,15 @@
 """Ralph Agent - ClaudeSDKClient wrapper with monitoring."""
 
 import asyncio
+import json
 import os
 import platform
+import queue
+import re
 import shutil
 import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import AsyncIterator, Callable, Optional
@@ -51,6 +56,7 @@ class KeyboardHandler:
         self._running = False
         self._old_settings = None
         self._supported = _HAS_TERMIOS and platform.system() != "Windows"
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def start(self) -> None:
         """Start listening for keyboard input."""
@@ -70,32 +76,76 @@ class KeyboardHandler:
     def stop(self) -> None:
         """Stop listening and restore terminal settings."""
         self._running = False
+        self.detach()
         if self._old_settings and self._supported:
             try:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._old_settings)
             except Exception:
                 pass
-    
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Register stdin with the event loop for readiness callbacks.
+
+        When supported, the kernel wakes us only when a byte is actually
+        available - no idle polling. Returns False if the event loop does
+        not support add_reader (e.g. ProactorEventLoop on Windows), in
+        which case callers should fall back to periodic check_input().
+        """
+        if not self._running:
+            return False
+
+        try:
+            loop.add_reader(sys.stdin.fileno(), self._on_readable)
+        except (NotImplementedError, OSError, ValueError):
+            return False
+
+        self._loop = loop
+        return True
+
+    def detach(self) -> None:
+        """Unregister stdin from the event loop."""
+        if self._loop:
+            try:
+                self._loop.remove_reader(sys.stdin.fileno())
+            except Exception:
+                pass
+            self._loop = None
+
+    def _on_readable(self) -> None:
+        """Event-loop callback: drain available input and dispatch keys."""
+        try:
+            data = os.read(sys.stdin.fileno(), 64)
+        except (BlockingIOError, OSError):
+            return
+
+        for char in data.decode("ascii", errors="ignore").lower():
+            self._dispatch(char)
+
+    def _dispatch(self, char: str) -> None:
+        """Dispatch a single control key to the display."""
+        if char == 'p':
+            self.display.request_pause()
+        elif char == 'g':
+            self.display.request_gutter()
+        elif char == 's' or char == 'q':
+            self.display.request_stop()
+        elif char == 'i':
+            self.display.request_intervene()
+
     def check_input(self) -> None:
         """Check for keyboard input (non-blocking).
-        
+
+        Polling fallback for event loops without add_reader support.
         Call this periodically during the loop.
         """
         if not self._running or not self._supported or not sys.stdin.isatty():
             return
-        
+
         try:
-            # Check if input is available
+            # Drain everything available in one read so pasted or rapid
+            # keystrokes don't queue up one-per-poll-tick
             if select.select([sys.stdin], [], [], 0)[0]:
-                char = sys.stdin.read(1).lower()
-                if char == 'p':
-                    self.display.request_pause()
-                elif char == 'g':
-                    self.display.request_gutter()
-                elif char == 's' or char == 'q':
-                    self.display.request_stop()
-                elif char == 'i':
-                    self.display.request_intervene()
+                self._on_readable()
         except Exception:
             pass
     
@@ -108,20 +158,80 @@ class KeyboardHandler:
         return False
 
 
-async def keyboard_listener(display: AgentDisplay) -> None:
-    """Async task that periodically checks for keyboard input."""
+async def keyboard_listener(
+    display: AgentDisplay,
+    shutdown: Optional[asyncio.Event] = None,
+) -> None:
+    """Async task that reacts to keyboard input.
+
+    Prefers event-driven readiness (loop.add_reader) so the task sleeps
+    until a key is actually pressed; falls back to 100ms polling on event
+    loops without add_reader support. Setting `shutdown` wakes the task
+    immediately instead of waiting for the next poll tick or cancellation.
+    """
     handler = KeyboardHandler(display)
     handler.start()
-    
+
+    if shutdown is None:
+        shutdown = asyncio.Event()
+
     try:
-        while True:
-            handler.check_input()
-            await asyncio.sleep(0.1)  # Check every 100ms
+        if handler.attach(asyncio.get_running_loop()):
+            # Event-driven: keys are dispatched by the loop's reader
+            # callback; sleep until shutdown or cancellation.
+            await shutdown.wait()
+        else:
+            while not shutdown.is_set():
+                handler.check_input()
+                try:
+                    await asyncio.wait_for(shutdown.wait(), timeout=0.1)
+                except asyncio.TimeoutError:
+                    pass  # Poll tick - check input again
     finally:
         handler.stop()
 
 
-@dataclass
+class _LazyJSON:
+    """Defers json.dumps of a tool input until the log line is written.
+
+    The drain thread stringifies this right before the write, keeping
+    serialization of potentially large payloads (e.g. Playwright
+    screenshots) off the event-loop thread.
+    """
+
+    __slots__ = ("label", "obj")
+
+    def __init__(self, label: str, obj):
+        self.label = label
+        self.obj = obj
+
+    def __str__(self) -> str:
+        if not self.obj:
+            return f"{self.label}: "
+        return f"{self.label}: " + json.dumps(self.obj, separators=(",", ":"))
+
+
+def _sum_usage_tokens(usage) -> tuple[int, int]:
+    """Sum token counts from a usage dict or object.
+
+    Returns (input_total, output) where input_total includes cache read
+    and cache creation tokens.
+    """
+    if hasattr(usage, "get"):
+        get = usage.get
+    else:
+        def get(key, default=0):
+            return getattr(usage, key, default)
+
+    input_total = (
+        get("input_tokens", 0)
+        + get("cache_read_input_tokens", 0)
+        + get("cache_creation_input_tokens", 0)
+    )
+    return input_total, get("output_tokens", 0)
+
+
+@dataclass(slots=True, frozen=True)
 class RunResult:
     """Result from a single agent run."""
     
@@ -151,6 +261,10 @@ class RalphAgent:
     COMPLETION_SIGNAL = "<promise>COMPLETE</promise>"
     SPEC_COMPLETE_SIGNAL = "<promise>SPEC_COMPLETE</promise>"
     GUTTER_SIGNAL = "<promise>GUTTER</promise>"
+
+    # Single-pass matcher for all completion signals - one linear scan of
+    # result_text instead of one substring search per signal
+    _SIGNAL_RE = re.compile(r"<promise>(SPEC_COMPLETE|COMPLETE|GUTTER)</promise>")
     
     # Default tools for different modes
     TOOLS_FULL = [
@@ -187,40 +301,162 @@ class RalphAgent:
             rotate_threshold: Percentage (0.0-1.0) at which to rotate context
             auto_gutter: Whether to automatically rotate context when threshold reached
         """
-        self.cwd = cwd or Path.cwd()
+        self.cwd = cwd or Path.cwd()  # Also caches the resolved form (see setter)
         self.display = display
         self.question_handler = question_handler
         self.log_file = log_file
+        # Call sites check this before building expensive log arguments
+        # (json.dumps etc.) - _log would only throw them away
+        self._log_enabled = log_file is not None
         self.mcp_servers = mcp_servers
         self.model = model
         self.context_limit = context_limit
         self.rotate_threshold = rotate_threshold
         self.auto_gutter = auto_gutter
+        # Find system Claude CLI once - which() walks $PATH and stats
+        # each entry, and the result doesn't change between iterations
+        self._system_cli = shutil.which("claude")
+        # Snapshot the environment once - os.environ is a proxy that
+        # re-reads on every iteration/copy
+        self._env_snapshot = dict(os.environ)
+        # Constant over the agent's lifetime - int compare in the hot path
+        self._rotate_threshold_tokens = int(self.context_limit * self.rotate_threshold)
         self._client: Optional[ClaudeSDKClient] = None
+        self._client_ctx = None  # Async context manager for the live client
+        self._client_fingerprint = None
+        # Permission handlers are pure functions of (mode, cwd) - cache
+        # them so client reuse isn't defeated by fresh closures per call
+        self._permission_handlers: dict[str, Callable] = {}
+        # Built ClaudeAgentOptions keyed by config fingerprint - only the
+        # prompt varies between run_loop iterations
+        self._options_cache: dict[tuple, ClaudeAgentOptions] = {}
+        # Bind once here instead of importing inside the message loop
+        # (a module-level import would pull the whole CLI package in)
+        from ..cli.registry import track_usage
+        self._track_usage = track_usage
+        self._text_parts: list[str] = []
+        # Exact-type dispatch for content blocks - one dict lookup per
+        # block instead of an isinstance chain (SDK never subclasses these)
+        self._block_dispatch = {
+            TextBlock: self._handle_text_block,
+            ThinkingBlock: self._handle_thinking_block,
+            ToolUseBlock: self._handle_tool_use_block,
+            ToolResultBlock: self._handle_tool_result_block,
+        }
         self._log_handle = None
-    
-    def _log(self, message: str, prefix: str = "") -> None:
-        """Write a message to the raw log file."""
+        self._log_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_thread: Optional[threading.Thread] = None
+        # Per-second timestamp cache for log lines
+        self._log_ts_sec = -1
+        self._log_ts_str = ""
+        # Gate for per-message display refreshes (monotonic seconds)
+        self._last_plan_refresh = 0.0
+
+    @property
+    def cwd(self) -> Path:
+        """Working directory for the agent."""
+        return self._cwd
+
+    @cwd.setter
+    def cwd(self, value: Path) -> None:
+        # Resolving makes syscalls (symlink walks), so cache the resolved
+        # string here and invalidate only when cwd is reassigned
+        self._cwd = value
+        self._cwd_resolved = str(value.resolve())
+
+    def _log(self, message: "str | _LazyJSON", prefix: str = "") -> None:
+        """Queue a message for the raw log file.
+
+        Formatting happens here; the actual write/flush is batched by a
+        background drain thread so the async hot path never blocks on I/O.
+        A _LazyJSON message is queued as (header, obj) and stringified by
+        the drain thread right before the write.
+        """
         if not self.log_file:
             return
-        
+
         try:
-            # Open file in append mode if not already open
-            if self._log_handle is None:
-                self._log_handle = open(self.log_file, "a", encoding="utf-8")
-            
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            if prefix:
-                self._log_handle.write(f"[{timestamp}] [{prefix}] {message}\n")
+            # Start the drain thread lazily on first log line
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(target=self._log_drain, daemon=True)
+                self._log_thread.start()
+
+            now = int(time.time())
+            if now != self._log_ts_sec:
+                self._log_ts_sec = now
+                self._log_ts_str = time.strftime("%H:%M:%S")
+            timestamp = self._log_ts_str
+
+            if isinstance(message, str):
+                if prefix:
+                    self._log_q.put(f"[{timestamp}] [{prefix}] {message}\n")
+                else:
+                    self._log_q.put(f"[{timestamp}] {message}\n")
             else:
-                self._log_handle.write(f"[{timestamp}] {message}\n")
-            self._log_handle.flush()
+                header = f"[{timestamp}] [{prefix}] " if prefix else f"[{timestamp}] "
+                self._log_q.put((header, message))
         except Exception:
             pass  # Don't let logging errors break the agent
-    
+
+    def _log_drain(self) -> None:
+        """Background thread: batch queued log lines into the file.
+
+        Amortizes write/flush syscalls across bursts of log lines instead
+        of flushing per line. A None item is the shutdown sentinel.
+        """
+        last_flush = time.monotonic()
+        try:
+            if self._log_handle is None:
+                # Binary mode with a large buffer: lines are encoded once
+                # here instead of going through TextIOWrapper's per-write
+                # encode + lock, and writes group into page-sized syscalls
+                self._log_handle = open(self.log_file, "ab", buffering=1024 * 1024)
+            handle = self._log_handle
+
+            stop = False
+            while not stop:
+                lines = [self._log_q.get()]
+                while True:
+                    try:
+                        lines.append(self._log_q.get_nowait())
+                    except queue.Empty:
+                        break
+
+                if lines[-1] is None:
+                    stop = True
+
+                if len(lines) > 1 or not stop:
+                    handle.writelines(
+                        self._format_log_item(item)
+                        for item in lines
+                        if item is not None
+                    )
+
+                now = time.monotonic()
+                if stop or now - last_flush > 0.25:
+                    handle.flush()
+                    last_flush = now
+        except Exception:
+            pass  # Don't let logging errors break the agent
+
+    @staticmethod
+    def _format_log_item(item) -> bytes:
+        """Encode a queued log item, stringifying lazy payloads here."""
+        if not isinstance(item, str):
+            header, obj = item
+            item = f"{header}{obj}\n"
+        return item.encode("utf-8", "replace")
+
     def _close_log(self) -> None:
-        """Close the log file handle."""
+        """Flush pending log lines and close the log file handle."""
+        if self._log_thread:
+            self._log_q.put(None)
+            try:
+                self._log_thread.join(timeout=2.0)
+            except Exception:
+                pass
+            self._log_thread = None
+
         if self._log_handle:
             try:
                 self._log_handle.close()
@@ -246,15 +482,18 @@ class RalphAgent:
             self.display.set_status("running")
             self.display.set_iteration(1)
         
-        result = await self._execute(
-            prompt=prompt,
-            permission_mode=permission_mode,
-            allowed_tools=self.TOOLS_FULL,
-        )
-        
+        try:
+            result = await self._execute(
+                prompt=prompt,
+                permission_mode=permission_mode,
+                allowed_tools=self.TOOLS_FULL,
+            )
+        finally:
+            await self.aclose()
+
         if self.display:
             self.display.set_status("complete" if result.success else "error")
-        
+
         return result
     
     async def run_loop(
@@ -287,66 +526,75 @@ class RalphAgent:
         """
         results = []
         exit_reason = "max_iterations"
-        
-        for i in range(start_iteration, max_iterations + 1):
-            if self.display:
-                self.display.set_iteration(i)
-                self.display.set_status("running")
-                self.display.log_activity("info", f"Starting iteration {i}/{max_iterations}")
-            
-            result = await self._execute(
-                prompt=prompt,
-                permission_mode=permission_mode,
-                allowed_tools=self.TOOLS_FULL,
-            )
-            results.append(result)
+
+        try:
+            for i in range(start_iteration, max_iterations + 1):
+                if self.display:
+                    self.display.set_iteration(i)
+                    self.display.set_status("running")
+                    self.display.log_activity("info", f"Starting iteration {i}/{max_iterations}")
             
-            # Call iteration complete callback if provided
-            if on_iteration_complete:
-                on_iteration_complete(i, result)
+                result = await self._execute(
+                    prompt=prompt,
+                    permission_mode=permission_mode,
+                    allowed_tools=self.TOOLS_FULL,
+                )
+                results.append(result)
             
-            if self.display:
-                self.display.set_status("complete" if result.success else "error")
+                # Call iteration complete callback if provided
+                if on_iteration_complete:
+                    on_iteration_complete(i, result)
             
-            # Check for completion signal
-            if result.is_complete:
                 if self.display:
-                    self.display.log_activity("complete", "PRD complete!")
-                exit_reason = "complete"
-                break
+                    self.display.set_status("complete" if result.success else "error")
             
-            # Check for gutter signal (agent is stuck or rotation needed)
-            if result.is_gutter:
-                if result.is_auto_gutter or result.is_user_gutter:
+                # Check for completion signal
+                if result.is_complete:
                     if self.display:
-                        reason = "Context limit" if result.is_auto_gutter else "User requested"
-                        self.display.log_activity("info", f"Rotating context ({reason})...")
-                    continue  # Start next iteration with fresh context
-                
-                if self.display:
-                    self.display.log_activity("warning", "GUTTER: Agent is stuck, stopping")
-                exit_reason = "gutter"
-                break
+                        self.display.log_activity("complete", "PRD complete!")
+                    exit_reason = "complete"
+                    break
             
-            if not result.success:
-                if self.display:
-                    self.display.log_activity("error", "Iteration failed, stopping")
-                exit_reason = "error"
-                break
+                # Check for gutter signal (agent is stuck or rotation needed)
+                if result.is_gutter:
+                    if result.is_auto_gutter or result.is_user_gutter:
+                        if self.display:
+                            reason = "Context limit" if result.is_auto_gutter else "User requested"
+                            self.display.log_activity("info", f"Rotating context ({reason})...")
+                        # Drop the live client: with session reuse the next
+                        # _execute would otherwise resume the same
+                        # conversation, carrying over the very context the
+                        # rotation is meant to shed (and re-tripping the
+                        # auto-gutter threshold immediately)
+                        await self.aclose()
+                        continue  # Start next iteration with fresh context
+                
+                    if self.display:
+                        self.display.log_activity("warning", "GUTTER: Agent is stuck, stopping")
+                    exit_reason = "gutter"
+                    break
             
-            # Check for pause/stop requests from display
-            if self.display:
-                if self.display.is_stop_requested():
-                    self.display.log_activity("stop", f"Stopped at iteration {i}")
-                    exit_reason = "stopped"
+                if not result.success:
+                    if self.display:
+                        self.display.log_activity("error", "Iteration failed, stopping")
+                    exit_reason = "error"
                     break
+            
+                # Check for pause/stop requests from display
+                if self.display:
+                    if self.display.is_stop_requested():
+                        self.display.log_activity("stop", f"Stopped at iteration {i}")
+                        exit_reason = "stopped"
+                        break
                 
-                if self.display.is_pause_requested():
-                    self.display.set_status("paused")
-                    self.display.log_activity("pause", f"Paused at iteration {i}")
-                    exit_reason = "paused"
-                    break
-        
+                    if self.display.is_pause_requested():
+                        self.display.set_status("paused")
+                        self.display.log_activity("pause", f"Paused at iteration {i}")
+                        exit_reason = "paused"
+                        break
+        finally:
+            await self.aclose()
+
         return results, exit_reason
     
     async def run_spec(
@@ -370,32 +618,87 @@ class RalphAgent:
         
         # Use interactive tools if we have a question handler
         tools = self.TOOLS_SPEC if self.question_handler else self.TOOLS_READONLY
-        
-        for i in range(1, max_iterations + 1):
-            if self.display:
-                self.display.set_iteration(i)
-                self.display.set_status("running")
-                self.display.log_activity("info", f"Spec iteration {i}/{max_iterations}")
-            
-            result = await self._execute(
-                prompt=prompt,
-                permission_mode="plan",  # Read-only mode
-                allowed_tools=tools,
-                interactive=bool(self.question_handler),
-            )
-            results.append(result)
+
+        try:
+            for i in range(1, max_iterations + 1):
+                if self.display:
+                    self.display.set_iteration(i)
+                    self.display.set_status("running")
+                    self.display.log_activity("info", f"Spec iteration {i}/{max_iterations}")
             
-            if self.display:
-                self.display.set_status("complete" if result.success else "error")
+                result = await self._execute(
+                    prompt=prompt,
+                    permission_mode="plan",  # Read-only mode
+                    allowed_tools=tools,
+                    interactive=bool(self.question_handler),
+                )
+                results.append(result)
             
-            # Check for spec completion signal
-            if self.SPEC_COMPLETE_SIGNAL in result.result_text:
                 if self.display:
-                    self.display.log_activity("complete", "Spec complete!")
-                break
-        
+                    self.display.set_status("complete" if result.success else "error")
+            
+                # Check for spec completion signal
+                if self.SPEC_COMPLETE_SIGNAL in result.result_text:
+                    if self.display:
+                        self.display.log_activity("complete", "Spec complete!")
+                    break
+        finally:
+            await self.aclose()
+
         return results
     
+    async def _get_client(self, options: ClaudeAgentOptions, fingerprint: tuple) -> ClaudeSDKClient:
+        """Return a connected client, reusing the live one when possible.
+
+        The client (and its CLI subprocess) is recreated only when the
+        effective configuration changed since the last call.
+        """
+        if self._client is not None and fingerprint == self._client_fingerprint:
+            return self._client
+
+        await self.aclose()
+
+        ctx = ClaudeSDKClient(options=options)
+        self._client = await ctx.__aenter__()
+        self._client_ctx = ctx
+        self._client_fingerprint = fingerprint
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the live client, if any."""
+        if self._client_ctx:
+            try:
+                await self._client_ctx.__aexit__(None, None, None)
+            except Exception:
+                pass
+            self._client_ctx = None
+            self._client = None
+            self._client_fingerprint = None
+
+    def _handle_text_block(self, block: TextBlock) -> None:
+        """Handle an assistant text block."""
+        self._text_parts.append(block.text)
+        self._log(block.text, "TEXT")
+        if self.display:
+            self.display.log_text(block.text)
+
+    def _handle_thinking_block(self, block: ThinkingBlock) -> None:
+        """Handle an assistant thinking block."""
+        self._log(block.thinking, "THINKING")
+        if self.display:
+            self.display.log_thinking(block.thinking)
+
+    def _handle_tool_use_block(self, block: ToolUseBlock) -> None:
+        """Log a tool use block (input serialized lazily off-loop)."""
+        if self._log_enabled:
+            self._log(_LazyJSON(block.name, block.input), "TOOL_USE")
+
+    def _handle_tool_result_block(self, block: ToolResultBlock) -> None:
+        """Log a tool result block (full, non-truncated)."""
+        if self._log_enabled:
+            content_str = str(block.content) if block.content else ""
+            self._log(f"[{block.tool_use_id}] {content_str}", "TOOL_RESULT")
+
     async def _execute(
         self,
         prompt: str,
@@ -414,68 +717,100 @@ class RalphAgent:
         Returns:
             RunResult with execution details
         """
-        # Find system Claude CLI to ensure same environment as user
-        # This fixes issues where the bundled CLI can't find Node/npm or browsers
-        system_cli = shutil.which("claude")
-        
-        # Build hooks for monitoring
-        hooks = None
-        if self.display:
-            hooks = create_monitoring_hooks(
-                on_tool_start=lambda name, inp: self.display.log_tool_use(name, inp),
-            )
-        
-        # Create permission handler to restrict file access to project directory
+        # Use the system Claude CLI (located once in __init__) to ensure
+        # same environment as user. This fixes issues where the bundled
+        # CLI can't find Node/npm or browsers
+        system_cli = self._system_cli
+
+        # Pick the permission handler flavor for this call
         if interactive and self.question_handler:
-            can_use_tool = create_interactive_permission_handler(
-                self.cwd,
-                self.question_handler,
-            )
+            handler_key = "interactive"
         elif permission_mode == "plan":
-            can_use_tool = create_readonly_permission_handler(self.cwd)
+            handler_key = "readonly"
         else:
-            can_use_tool = create_project_permission_handler(self.cwd)
-        
-        # Build MCP servers config with environment inheritance
-        # This ensures Playwright and other MCP servers can find system tools/browsers
-        mcp_servers = None
-        if self.mcp_servers:
-            mcp_servers = {}
-            for name, config in self.mcp_servers.items():
-                mcp_servers[name] = config.copy()
-                # Ensure each MCP server inherits the system environment (PATH, HOME, etc.)
-                if "env" not in mcp_servers[name]:
-                    mcp_servers[name]["env"] = {}
-                
-                # Merge current environment
-                mcp_servers[name]["env"].update(os.environ)
-        
-        # Build options
-        options_kwargs = {
-            "model": self.model,
-            "cwd": str(self.cwd.resolve()),
-            "permission_mode": permission_mode,
-            "allowed_tools": allowed_tools,
-            "hooks": hooks,
-            "can_use_tool": can_use_tool,
-            "cli_path": system_cli,
-            "setting_sources": ["project"],
-            "max_buffer_size": 10 * 1024 * 1024,  # 10MB for large Playwright screenshots
-        }
-        
-        if mcp_servers:
-            options_kwargs["mcp_servers"] = mcp_servers
-        
-        options = ClaudeAgentOptions(**options_kwargs)
-        
+            handler_key = "project"
+
+        # Config fingerprint: identical across run_loop iterations (only
+        # the prompt changes), so it keys both the options cache and the
+        # live-client reuse below
+        fingerprint = (
+            self.model,
+            self._cwd_resolved,
+            permission_mode,
+            tuple(allowed_tools),
+            handler_key,
+        )
+
+        options = self._options_cache.get(fingerprint)
+        if options is None:
+            # Build hooks for monitoring
+            hooks = None
+            if self.display:
+                hooks = create_monitoring_hooks(
+                    on_tool_start=lambda name, inp: self.display.log_tool_use(name, inp),
+                )
+
+            # Create permission handler to restrict file access to project
+            # directory. Built from the resolved cwd - the same form the
+            # SDK is given - so a symlinked project path can't make the
+            # handler's prefix checks deny the agent's real-path accesses
+            can_use_tool = self._permission_handlers.get(handler_key)
+            if can_use_tool is None:
+                resolved_cwd = Path(self._cwd_resolved)
+                if handler_key == "interactive":
+                    can_use_tool = create_interactive_permission_handler(
+                        resolved_cwd,
+                        self.question_handler,
+                    )
+                elif handler_key == "readonly":
+                    can_use_tool = create_readonly_permission_handler(resolved_cwd)
+                else:
+                    can_use_tool = create_project_permission_handler(resolved_cwd)
+                self._permission_handlers[handler_key] = can_use_tool
+
+            # Build MCP servers config with environment inheritance
+            # This ensures Playwright and other MCP servers can find system tools/browsers
+            mcp_servers = None
+            if self.mcp_servers:
+                # Ensure each MCP server inherits the system environment
+                # (PATH, HOME, etc.), reusing the snapshot taken in __init__
+                base_env = self._env_snapshot
+                mcp_servers = {
+                    name: {**config, "env": {**base_env, **config.get("env", {})}}
+                    for name, config in self.mcp_servers.items()
+                }
+
+            # Build options
+            options_kwargs = {
+                "model": self.model,
+                "cwd": self._cwd_resolved,
+                "permission_mode": permission_mode,
+                "allowed_tools": allowed_tools,
+                "hooks": hooks,
+                "can_use_tool": can_use_tool,
+                "cli_path": system_cli,
+                "setting_sources": ["project"],
+                "max_buffer_size": 10 * 1024 * 1024,  # 10MB for large Playwright screenshots
+            }
+
+            if mcp_servers:
+                options_kwargs["mcp_servers"] = mcp_servers
+
+            options = ClaudeAgentOptions(**options_kwargs)
+            self._options_cache[fingerprint] = options
+
         # Execute with client
-        result_text = ""
+        # Accumulate text chunks in a list and join once at the end -
+        # repeated str += is quadratic in total output size
+        self._text_parts = []
+        result_text = None
         input_tokens = 0
         output_tokens = 0
         cost_usd = 0.0
         duration_ms = 0
         num_turns = 0
         success = True
+        threshold_fired = False  # Context threshold breached mid-stream
         
         try:
             # Log iteration start
@@ -487,159 +822,161 @@ class RalphAgent:
                 self._log(f"MCP servers: {list(self.mcp_servers.keys())}", "CONFIG")
             self._log("-" * 80, "")
             
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
+            client = await self._get_client(options, fingerprint)
+            await client.query(prompt)
+
+            # Process messages in a loop that supports intervention
+            while True:
+                got_result = False
                 
-                # Process messages in a loop that supports intervention
-                while True:
-                    got_result = False
-                    
-                    async for message in client.receive_response():
-                        # Check for intervention request (between messages)
-                        if self.display and self.display.is_intervene_requested():
-                            self.display.clear_intervene()
-                            self._log("INTERVENTION requested by user", "INTERVENE")
-                            
-                            # Interrupt current execution
-                            await client.interrupt()
-                            
-                            # Prompt user for intervention text
-                            intervention_text = self.display.prompt_intervene()
-                            
-                            if intervention_text:
-                                self._log(f"Intervention: {intervention_text}", "INTERVENE")
-                                # Send the intervention as a new query continuing the conversation
-                                await client.query(f"[USER INTERVENTION] {intervention_text}")
-                                # Break to re-enter message processing loop
-                                break
-                            else:
-                                self._log("Intervention cancelled", "INTERVENE")
-                                # Resume normal processing - the break will exit and we'll continue
-                                await client.query("Continue with what you were doing.")
-                                break
+                async for message in client.receive_response():
+                    # Check for intervention request (between messages)
+                    if self.display and self.display.is_intervene_requested():
+                        self.display.clear_intervene()
+                        self._log("INTERVENTION requested by user", "INTERVENE")
                         
-                        # Process different message types
-                        if isinstance(message, AssistantMessage):
-                            # A turn finished (Assistant replied)
-                            from ..cli.registry import track_usage
-                            track_usage(1)
-                            
-                            if self.display:
-                                self.display.stats.session_turns += 1
-                                
-                                # Check if current message has usage info (SDK dependent)
-                                # NOTE: Most SDK AssistantMessage objects don't have usage yet
-                                usage = getattr(message, "usage", None)
-                                if usage:
-                                    def get_val(obj, key, default=0):
-                                        if hasattr(obj, "get"):
-                                            return obj.get(key, default)
-                                        return getattr(obj, key, default)
-
-                                    current_in = get_val(usage, "input_tokens")
-                                    current_in += get_val(usage, "cache_read_input_tokens")
-                                    current_in += get_val(usage, "cache_creation_input_tokens")
-                                    current_out = get_val(usage, "output_tokens")
-                                    
-                                    self.display.update_stats(
-                                        input_tokens=current_in,
-                                        output_tokens=current_out,
-                                        context_used_tokens=current_in,
-                                        context_limit=self.context_limit,
-                                    )
-                                else:
-                                    # Just update plan usage if no token info yet
-                                    self.display._update_plan_usage()
-                                    self.display.refresh()
-                                    
-                            for block in message.content:
-                                if isinstance(block, TextBlock):
-                                    result_text += block.text
-                                    self._log(block.text, "TEXT")
-                                    if self.display:
-                                        self.display.log_text(block.text)
-                                elif isinstance(block, ThinkingBlock):
-                                    self._log(block.thinking, "THINKING")
-                                    if self.display:
-                                        self.display.log_thinking(block.thinking)
-                                elif isinstance(block, ToolUseBlock):
-                                    # Log tool use
-                                    import json
-                                    tool_input_str = json.dumps(block.input, indent=2) if block.input else ""
-                                    self._log(f"{block.name}: {tool_input_str}", "TOOL_USE")
-                                elif isinstance(block, ToolResultBlock):
-                                    # Log tool result (full, non-truncated)
-                                    content_str = str(block.content) if block.content else ""
-                                    self._log(f"[{block.tool_use_id}] {content_str}", "TOOL_RESULT")
+                        # Interrupt current execution
+                        await client.interrupt()
                         
-                        elif isinstance(message, ResultMessage):
-                            # Extract stats from result
-                            success = not message.is_error
-                            duration_ms = message.duration_ms
-                            num_turns = message.num_turns
-                            got_result = True
-                            
-                            if message.usage:
-                                def get_val(obj, key, default=0):
-                                    if hasattr(obj, "get"):
-                                        return obj.get(key, default)
-                                    return getattr(obj, key, default)
-
-                                # Sum ALL input tokens (including cache)
-                                input_tokens = get_val(message.usage, "input_tokens")
-                                input_tokens += get_val(message.usage, "cache_read_input_tokens")
-                                input_tokens += get_val(message.usage, "cache_creation_input_tokens")
-                                output_tokens = get_val(message.usage, "output_tokens")
-                            
-                            if message.total_cost_usd:
-                                cost_usd = message.total_cost_usd
-                            
-                            if message.result:
-                                result_text = message.result
-                            
-                            # Log result summary
-                            self._log(f"Success: {success}, Tokens: {input_tokens}/{output_tokens}, Cost: ${cost_usd:.2f}", "RESULT")
+                        # Prompt user for intervention text
+                        intervention_text = self.display.prompt_intervene()
+                        
+                        if intervention_text:
+                            self._log(f"Intervention: {intervention_text}", "INTERVENE")
+                            # Send the intervention as a new query continuing the conversation
+                            await client.query(f"[USER INTERVENTION] {intervention_text}")
+                            # Break to re-enter message processing loop
+                            break
+                        else:
+                            self._log("Intervention cancelled", "INTERVENE")
+                            # Resume normal processing - the break will exit and we'll continue
+                            await client.query("Continue with what you were doing.")
+                            break
+                    
+                    # Process different message types
+                    if isinstance(message, AssistantMessage):
+                        # A turn finished (Assistant replied)
+                        self._track_usage(1)
+                        
+                        if self.display:
+                            self.display.stats.session_turns += 1
                             
-                            # Update display stats with final iteration numbers
-                            if self.display:
+                            # Check if current message has usage info (SDK dependent)
+                            # NOTE: Most SDK AssistantMessage objects don't have usage yet
+                            usage = getattr(message, "usage", None)
+                            if usage:
+                                current_in, current_out = _sum_usage_tokens(usage)
+
                                 self.display.update_stats(
-                                    input_tokens=input_tokens,
-                                    output_tokens=output_tokens,
-                                    cost_usd=cost_usd,
-                                    duration_ms=duration_ms,
-                                    num_turns=num_turns,
-                                    context_used_tokens=input_tokens,
+                                    input_tokens=current_in,
+                                    output_tokens=current_out,
+                                    context_used_tokens=current_in,
                                     context_limit=self.context_limit,
                                 )
-                                self.display.finish_iteration()
+
+                                # Cut the iteration short as soon as the
+                                # rotate threshold is breached - the rest
+                                # of the reply would be rotated out anyway
+                                if (
+                                    self.auto_gutter
+                                    and not threshold_fired
+                                    and current_in > self._rotate_threshold_tokens
+                                ):
+                                    threshold_fired = True
+                                    self._log(
+                                        f"Context threshold exceeded mid-iteration ({current_in:,} tokens) - interrupting",
+                                        "GUTTER",
+                                    )
+                                    await client.interrupt()
+                            else:
+                                # Just update plan usage if no token info yet.
+                                # Throttled: this fires for every
+                                # AssistantMessage and a full Live re-render
+                                # is expensive. The final ResultMessage path
+                                # refreshes unconditionally.
+                                now = time.monotonic()
+                                if now - self._last_plan_refresh >= 0.1:
+                                    self._last_plan_refresh = now
+                                    self.display._update_plan_usage()
+                                    self.display.refresh()
+                                
+                        block_dispatch = self._block_dispatch
+                        for block in message.content:
+                            handler = block_dispatch.get(type(block))
+                            if handler:
+                                handler(block)
                     
-                    # Exit the outer while loop if we got a result (iteration complete)
-                    if got_result:
-                        break
-        
+                    elif isinstance(message, ResultMessage):
+                        # Extract stats from result
+                        success = not message.is_error
+                        duration_ms = message.duration_ms
+                        num_turns = message.num_turns
+                        got_result = True
+                        
+                        if message.usage:
+                            # Sum ALL input tokens (including cache)
+                            input_tokens, output_tokens = _sum_usage_tokens(message.usage)
+                        
+                        if message.total_cost_usd:
+                            cost_usd = message.total_cost_usd
+                        
+                        if message.result:
+                            result_text = message.result
+                        
+                        # Log result summary
+                        self._log(f"Success: {success}, Tokens: {input_tokens}/{output_tokens}, Cost: ${cost_usd:.2f}", "RESULT")
+                        
+                        # Update display stats with final iteration numbers
+                        if self.display:
+                            self.display.update_stats(
+                                input_tokens=input_tokens,
+                                output_tokens=output_tokens,
+                                cost_usd=cost_usd,
+                                duration_ms=duration_ms,
+                                num_turns=num_turns,
+                                context_used_tokens=input_tokens,
+                                context_limit=self.context_limit,
+                            )
+                            self.display.finish_iteration()
+                
+                # Exit the outer while loop if we got a result (iteration complete)
+                if got_result:
+                    break
+    
         except Exception as e:
             success = False
             result_text = str(e)
             self._log(f"Error: {e}", "ERROR")
             if self.display:
                 self.display.log_activity("error", f"Error: {e}")
+            # The client may be in a broken state - drop it so the next
+            # iteration starts fresh
+            await self.aclose()
         
-        # Check for completion signals
-        is_complete = (
-            self.COMPLETION_SIGNAL in result_text or
-            self.SPEC_COMPLETE_SIGNAL in result_text
-        )
-        # Gutter if signal in text OR user requested it via keyboard
-        is_gutter = self.GUTTER_SIGNAL in result_text
+        if result_text is None:
+            result_text = "".join(self._text_parts)
+
+        # Check for completion signals. str.find on the shared "<promise>"
+        # prefix rules out the common no-signal case with a plain memchr
+        # scan; the regex then only walks the text from the first hit
+        is_complete = False
+        is_gutter = False
+        signal_idx = result_text.find("<promise>")
+        if signal_idx != -1:
+            signals = set(self._SIGNAL_RE.findall(result_text, signal_idx))
+            is_complete = "COMPLETE" in signals or "SPEC_COMPLETE" in signals
+            # Gutter if signal in text OR user requested it via keyboard
+            is_gutter = "GUTTER" in signals
         is_user_gutter = False
         if self.display and self.display.is_gutter_requested():
             is_user_gutter = True
             is_gutter = True
             self.display.clear_gutter()
             
-        # Auto-gutter if context usage exceeds threshold and auto_gutter is enabled
+        # Auto-gutter if context usage exceeds threshold and auto_gutter is
+        # enabled - either caught mid-stream above or in the final tally
         is_auto_gutter = False
-        if self.auto_gutter and input_tokens > (self.context_limit * self.rotate_threshold):
+        if self.auto_gutter and (threshold_fired or input_tokens > self._rotate_threshold_tokens):
             is_auto_gutter = True
             is_gutter = True
             if self.display:
@@ -1,109 +1,138 @@
 """Monitoring hooks for Ralph agent."""
 
+import asyncio
 from typing import Any, Callable, Optional
 
 from claude_agent_sdk import HookMatcher, HookContext
 
 
+def _log_read(tool_input: dict) -> str:
+    return f"r Reading: {tool_input.get('file_path', '?')}"
+
+
+def _log_write(tool_input: dict) -> str:
+    return f"w Writing: {tool_input.get('file_path', '?')}"
+
+
+def _log_bash(tool_input: dict) -> str:
+    cmd = tool_input.get("command", "")
+    cmd_short = cmd[:50] + "..." if len(cmd) > 50 else cmd
+    return f"$ Running: {cmd_short}"
+
+
+def _log_glob(tool_input: dict) -> str:
+    return f"? Searching: {tool_input.get('pattern', '?')}"
+
+
+def _log_grep(tool_input: dict) -> str:
+    return f"? Grep: {tool_input.get('pattern', '?')}"
+
+
+# tool_name -> log-line formatter, built once at import instead of a
+# per-call if/elif chain
+_LOG_FORMATTERS: dict[str, Callable[[dict], str]] = {
+    "Read": _log_read,
+    "Write": _log_write,
+    "Edit": _log_write,
+    "Bash": _log_bash,
+    "Glob": _log_glob,
+    "Grep": _log_grep,
+}
+
+
 def create_monitoring_hooks(
     on_tool_start: Optional[Callable[[str, dict], None]] = None,
     on_tool_end: Optional[Callable[[str, dict, Any], None]] = None,
 ) -> dict[str, list[HookMatcher]]:
     """Create monitoring hooks for tracking agent activity.
-    
+
     Args:
         on_tool_start: Callback when a tool starts (tool_name, tool_input)
         on_tool_end: Callback when a tool completes (tool_name, tool_input, result)
-    
+
     Returns:
-        Dictionary of hooks to pass to ClaudeAgentOptions
+        Dictionary of hooks to pass to ClaudeAgentOptions. Categories
+        whose callback is None are omitted entirely so the SDK never
+        pays a coroutine round-trip for a no-op hook.
     """
-    
+
     async def pre_tool_hook(
         input_data: dict[str, Any],
         tool_use_id: str | None,
         context: HookContext,
     ) -> dict[str, Any]:
         """Hook called before tool execution."""
-        tool_name = input_data.get("tool_name", "")
-        tool_input = input_data.get("tool_input", {})
-        
-        if on_tool_start:
-            on_tool_start(tool_name, tool_input)
-        
+        on_tool_start(
+            input_data.get("tool_name", ""),
+            input_data.get("tool_input") or {},
+        )
         return {}
-    
+
     async def post_tool_hook(
         input_data: dict[str, Any],
         tool_use_id: str | None,
         context: HookContext,
     ) -> dict[str, Any]:
-        """Hook called after tool execution."""
-        tool_name = input_data.get("tool_name", "")
-        tool_input = input_data.get("tool_input", {})
-        tool_result = input_data.get("tool_result", {})
-        
-        if on_tool_end:
-            on_tool_end(tool_name, tool_input, tool_result)
-        
+        """Hook called after tool execution.
+
+        The callback is informational only, so it's deferred to the next
+        event-loop pass instead of blocking the agent on UI work.
+        PreToolUse stays synchronous since it may gate tool execution.
+        """
+        asyncio.get_running_loop().call_soon(
+            on_tool_end,
+            input_data.get("tool_name", ""),
+            input_data.get("tool_input") or {},
+            input_data.get("tool_result") or {},
+        )
         return {}
-    
-    return {
-        "PreToolUse": [HookMatcher(hooks=[pre_tool_hook])],
-        "PostToolUse": [HookMatcher(hooks=[post_tool_hook])],
-    }
+
+    hooks: dict[str, list[HookMatcher]] = {}
+    if on_tool_start is not None:
+        hooks["PreToolUse"] = [HookMatcher(hooks=[pre_tool_hook])]
+    if on_tool_end is not None:
+        hooks["PostToolUse"] = [HookMatcher(hooks=[post_tool_hook])]
+    return hooks
 
 
 def create_logging_hooks(log_func: Callable[[str], None]) -> dict[str, list[HookMatcher]]:
     """Create simple logging hooks.
-    
+
     Args:
         log_func: Function to call with log messages
-    
+
     Returns:
         Dictionary of hooks to pass to ClaudeAgentOptions
     """
-    
+
     async def log_pre_tool(
         input_data: dict[str, Any],
         tool_use_id: str | None,
         context: HookContext,
     ) -> dict[str, Any]:
         tool_name = input_data.get("tool_name", "")
-        tool_input = input_data.get("tool_input", {})
-        
-        # Format log message based on tool
-        if tool_name == "Read":
-            log_func(f"r Reading: {tool_input.get('file_path', '?')}")
-        elif tool_name in ("Write", "Edit"):
-            log_func(f"w Writing: {tool_input.get('file_path', '?')}")
-        elif tool_name == "Bash":
-            cmd = tool_input.get("command", "")
-            cmd_short = cmd[:50] + "..." if len(cmd) > 50 else cmd
-            log_func(f"$ Running: {cmd_short}")
-        elif tool_name == "Glob":
-            log_func(f"? Searching: {tool_input.get('pattern', '?')}")
-        elif tool_name == "Grep":
-            log_func(f"? Grep: {tool_input.get('pattern', '?')}")
+
+        # Format log message based on tool - dict dispatch, one lookup
+        fmt = _LOG_FORMATTERS.get(tool_name)
+        if fmt is not None:
+            log_func(fmt(input_data.get("tool_input") or {}))
         else:
             log_func(f"› Tool: {tool_name}")
-        
+
         return {}
-    
+
     async def log_post_tool(
         input_data: dict[str, Any],
         tool_use_id: str | None,
         context: HookContext,
     ) -> dict[str, Any]:
-        tool_name = input_data.get("tool_name", "")
-        tool_result = input_data.get("tool_result", {})
-        
         # Check for errors
-        if tool_result.get("is_error"):
-            log_func(f"x {tool_name} failed")
-        
+        tool_result = input_data.get("tool_result")
+        if tool_result and tool_result.get("is_error"):
+            log_func(f"x {input_data.get('tool_name', '')} failed")
+
         return {}
-    
+
     return {
         "PreToolUse": [HookMatcher(hooks=[log_pre_tool])],
         "PostToolUse": [HookMatcher(hooks=[log_post_tool])],
@@ -1,9 +1,16 @@
 """Real-time display formatting for Ralph agent output."""
 
+import asyncio
+import json
 import os
 import platform
+import re
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
@@ -16,6 +23,10 @@ from rich.box import ROUNDED
 # Check if keyboard controls are supported (Unix only)
 _KEYBOARD_SUPPORTED = platform.system() != "Windows"
 
+# Whitespace runs collapsed in one C-level pass (vs. split+join's
+# intermediate list per log event)
+_WS_RE = re.compile(r"\s+")
+
 
 def get_terminal_width() -> int:
     """Get terminal width with a sensible default."""
@@ -25,7 +36,7 @@ def get_terminal_width() -> int:
         return 120  # Default fallback
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStats:
     """Statistics for current agent run."""
     
@@ -64,14 +75,53 @@ class AgentStats:
     session_turns: int = 0
 
 
-@dataclass
-class ActivityLog:
-    """Single activity entry."""
-    
-    timestamp: datetime
-    icon: str
-    message: str
-    detail: str = ""
+def _truncate_path(path: str, max_len: int) -> str:
+    """Truncate a file path intelligently, keeping the filename visible."""
+    if len(path) <= max_len:
+        return path
+
+    # Try to show .../<last_two_components>
+    parts = path.split("/")
+    if len(parts) >= 2:
+        suffix = "/".join(parts[-2:])
+        if len(suffix) + 4 <= max_len:
+            return ".../" + suffix
+
+    # Just truncate from the beginning
+    return "..." + path[-(max_len-3):]
+
+
+def _fmt_path(tool_input: dict, max_len: int) -> str:
+    """Format a file-path tool input (Read/Write/Edit)."""
+    return _truncate_path(tool_input.get("file_path", ""), max_len)
+
+
+def _fmt_bash(tool_input: dict, max_len: int) -> str:
+    """Format a Bash command, collapsing whitespace."""
+    cmd = " ".join(tool_input.get("command", "").split())
+    return cmd[:max_len] + "..." if len(cmd) > max_len else cmd
+
+
+def _fmt_glob(tool_input: dict, max_len: int) -> str:
+    """Format a Glob pattern."""
+    pattern = tool_input.get("pattern", "")
+    return pattern[:max_len] if len(pattern) <= max_len else pattern[:max_len-3] + "..."
+
+
+def _fmt_grep(tool_input: dict, max_len: int) -> str:
+    """Format a Grep pattern, quoted."""
+    pattern = tool_input.get("pattern", "")
+    return f'"{pattern[:max_len-4]}..."' if len(pattern) > max_len-2 else f'"{pattern}"'
+
+
+def _fmt_todo(tool_input: dict, max_len: int) -> str:
+    """Format a TodoWrite input."""
+    return "(updating task list)"
+
+
+def _fmt_default(tool_input: dict, max_len: int) -> str:
+    """Fallback formatter for unknown tools."""
+    return ""
 
 
 class AgentDisplay:
@@ -96,6 +146,23 @@ class AgentDisplay:
         "stop": "x",
     }
     
+    # tool_name -> (icon_key, formatter) - one hash lookup per tool log
+    # instead of chained string comparisons
+    _TOOL_FORMATTERS = {
+        "Read": ("file_read", _fmt_path),
+        "Write": ("file_write", _fmt_path),
+        "Edit": ("file_write", _fmt_path),
+        "Bash": ("bash", _fmt_bash),
+        "Glob": ("search", _fmt_glob),
+        "Grep": ("search", _fmt_grep),
+        "TodoWrite": ("task", _fmt_todo),
+    }
+    _DEFAULT_FORMATTER = ("tool", _fmt_default)
+
+    # Progress bar template: any 20-char window holds the right mix of
+    # filled/empty blocks (slice at 20-filled)
+    _FULL_BAR = "█" * 20 + "░" * 20
+
     # Fixed dimensions for activity panel
     ACTIVITY_PANEL_HEIGHT = 14
     MIN_PANEL_WIDTH = 100
@@ -104,18 +171,54 @@ class AgentDisplay:
     def __init__(self, total_iterations: int = 1, mode: str = "loop", plan_limit: int = 225):
         self.console = Console()
         self.stats = AgentStats(total_iterations=total_iterations, plan_messages_limit=plan_limit)
-        self.activities: list[ActivityLog] = []
         self.mode = mode
         self.max_activities = 20
+        # Activity buffer in struct-of-arrays form: four bounded parallel
+        # deques instead of one object allocation per entry. Appends are
+        # O(1) and old entries fall off the front automatically
+        maxlen = self.max_activities
+        self._act_timestamps: deque[datetime] = deque(maxlen=maxlen)
+        self._act_icons: deque[str] = deque(maxlen=maxlen)
+        self._act_messages: deque[str] = deque(maxlen=maxlen)
+        self._act_details: deque[str] = deque(maxlen=maxlen)
+        # Guards the parallel deques: log_activity appends on the event
+        # loop while _render runs on Live's refresh thread, and without
+        # the lock a render can see a half-appended entry (or die with
+        # "deque mutated during iteration")
+        self._act_lock = threading.Lock()
         self._live: Optional[Live] = None
+        self._plan_usage_task: Optional[asyncio.Task] = None
+        # Per-section dirty bits: _render reuses cached sub-renders until
+        # a mutator flags the section (stats rebuild every time - elapsed
+        # time is always moving)
+        self._dirty = {"header": True, "task": True, "activities": True}
+        self._render_cache: dict[str, object] = {}
         self._paused = False
         self._stop_requested = False
         self._gutter_requested = False
         self._intervene_requested = False
         
-        # Capture baseline usage at start to avoid double-counting current session
+        # Bind the registry accessor once - a module-level import would be
+        # circular (cli imports agent), and re-importing per refresh costs
+        # a frame + attribute lookup each time
         from ..cli.registry import get_today_usage
+        self._get_today_usage = get_today_usage
+
+        # Capture baseline usage at start to avoid double-counting current session
         self.initial_ralph_usage = get_today_usage()
+
+        # Parsed stats-cache.json contents, re-read only when the file's
+        # mtime changes; per-day counts are kept as a dict so the daily
+        # lookup is O(1) and a date rollover needs no re-parse
+        self._stats_cache_mtime = 0
+        self._daily_msg_counts: dict[str, int] = {}
+        # Today's date string, recomputed only when the day rolls over
+        # (strftime is surprisingly costly to run per refresh)
+        self._today_key = ""
+        self._today_key_expires = 0.0
+        # Combined message baseline (stats-cache + usage registry), kept
+        # current by the refresher so the fast path never touches disk
+        self._plan_baseline = 0
         
         # Calculate panel width based on terminal
         term_width = get_terminal_width()
@@ -123,6 +226,14 @@ class AgentDisplay:
             self.MIN_PANEL_WIDTH,
             min(term_width - 4, self.MAX_PANEL_WIDTH)
         )
+        # Fixed for the run (no resize handling) - computed once here
+        # instead of per tool log
+        self._tool_detail_max_len = int(self.panel_width * 0.4)
+        # Activity header separator, likewise constant per run
+        self._activity_header = (
+            f"[blue]{'─' * 4} [/][bold blue]ACTIVITY[/]"
+            f"[blue] {'─' * (self.panel_width - 16)}[/]"
+        )
         
         # Load initial plan usage
         self._update_plan_usage()
@@ -130,16 +241,30 @@ class AgentDisplay:
     def start(self) -> None:
         """Start the live display."""
         self.console.clear()
+        # Live pulls _render via get_renderable on its own 4 Hz refresh
+        # thread, keeping Rich rendering off the agent's event loop
         self._live = Live(
-            self._render(),
+            get_renderable=self._render,
             console=self.console,
             refresh_per_second=4,
             transient=True,  # Replace content instead of stacking
         )
         self._live.start()
-    
+
+        # Move plan-usage file I/O off the render path: a background task
+        # refreshes the counters while _update_plan_usage stays cheap
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._plan_usage_task = None
+        else:
+            self._plan_usage_task = loop.create_task(self._plan_usage_refresher())
+
     def stop(self) -> None:
         """Stop the live display."""
+        if self._plan_usage_task:
+            self._plan_usage_task.cancel()
+            self._plan_usage_task = None
         if self._live:
             self._live.stop()
             # Print final state so it persists after stopping
@@ -147,9 +272,14 @@ class AgentDisplay:
             self._live = None
     
     def refresh(self) -> None:
-        """Refresh the display."""
-        if self._live:
-            self._live.update(self._render())
+        """Request a display refresh.
+
+        Rendering is pulled by Live's background refresh thread via
+        get_renderable at 4 Hz, so mutators only need to update state -
+        no Rich work runs on the caller's (event loop) thread. Kept as a
+        method so call sites read naturally and a push model could be
+        restored later.
+        """
     
     def set_iteration(self, iteration: int) -> None:
         """Set current iteration number and start timer."""
@@ -163,18 +293,21 @@ class AgentDisplay:
         
         # Update plan usage at start of iteration so it's live
         self._update_plan_usage()
-        
+
+        self._mark_dirty("header")
         self.refresh()
     
     def set_task(self, task: str, task_id: str = "") -> None:
         """Set current task description and ID."""
         self.stats.current_task = task
         self.stats.current_task_id = task_id
+        self._mark_dirty("task")
         self.refresh()
     
     def set_status(self, status: str) -> None:
         """Set current status."""
         self.stats.status = status
+        self._mark_dirty("header")
         self.refresh()
     
     def request_pause(self) -> None:
@@ -269,7 +402,7 @@ class AgentDisplay:
         # Clear and restart the live display
         self.console.clear()
         self._live = Live(
-            self._render(),
+            get_renderable=self._render,
             console=self.console,
             refresh_per_second=4,
             transient=True,
@@ -278,19 +411,21 @@ class AgentDisplay:
         
         return intervention_text
     
-    def update_stats(
-        self,
-        input_tokens: Optional[int] = None,
-        output_tokens: Optional[int] = None,
-        cost_usd: Optional[float] = None,
-        duration_ms: Optional[int] = None,
-        num_turns: Optional[int] = None,
-        context_used_tokens: Optional[int] = None,
-        context_limit: Optional[int] = None,
-    ) -> None:
+    # update_stats kwarg -> AgentStats field
+    _STAT_FIELDS = {
+        "input_tokens": "input_tokens",
+        "output_tokens": "output_tokens",
+        "cost_usd": "total_cost_usd",
+        "duration_ms": "duration_ms",
+        "num_turns": "num_turns",
+        "context_used_tokens": "context_used_tokens",
+        "context_limit": "context_limit",
+    }
+
+    def update_stats(self, **kwargs) -> None:
         """Update statistics for the CURRENT iteration.
-        
-        Args:
+
+        Keyword Args:
             input_tokens: Total input tokens used in this iteration so far
             output_tokens: Total output tokens used in this iteration so far
             cost_usd: Total cost for this iteration so far
@@ -298,33 +433,26 @@ class AgentDisplay:
             num_turns: Total turns in this iteration so far
             context_used_tokens: Current context size estimate
             context_limit: Model context limit
+
+        None values are skipped; the single assignment loop replaces the
+        old chain of per-field guards on this hot call site.
         """
-        if input_tokens is not None:
-            self.stats.input_tokens = input_tokens
-        if output_tokens is not None:
-            self.stats.output_tokens = output_tokens
-        if cost_usd is not None:
-            self.stats.total_cost_usd = cost_usd
-        if duration_ms is not None:
-            self.stats.duration_ms = duration_ms
-        if num_turns is not None:
-            self.stats.num_turns = num_turns
-        
-        if context_used_tokens is not None:
-            self.stats.context_used_tokens = context_used_tokens
-        elif input_tokens is not None:
+        stats = self.stats
+        fields = self._STAT_FIELDS
+        for key, value in kwargs.items():
+            if value is not None:
+                setattr(stats, fields[key], value)
+
+        if kwargs.get("context_used_tokens") is None and kwargs.get("input_tokens") is not None:
             # Fallback: current iteration's input tokens represent current context
-            self.stats.context_used_tokens = input_tokens
-            
-        if context_limit is not None:
-            self.stats.context_limit = context_limit
-            
-        if self.stats.context_limit > 0:
-            self.stats.context_used_pct = (self.stats.context_used_tokens / self.stats.context_limit) * 100
-        
+            stats.context_used_tokens = kwargs["input_tokens"]
+
+        if stats.context_limit > 0:
+            stats.context_used_pct = (stats.context_used_tokens / stats.context_limit) * 100
+
         # Update plan usage
         self._update_plan_usage()
-        
+
         self.refresh()
 
     def finish_iteration(self) -> None:
@@ -335,38 +463,67 @@ class AgentDisplay:
         self.stats.cumulative_duration_ms += self.stats.duration_ms
         self.refresh()
     
+    async def _plan_usage_refresher(self) -> None:
+        """Periodically refresh plan usage counters off the render path."""
+        while True:
+            await asyncio.sleep(5)
+            self._refresh_plan_usage()
+
     def _update_plan_usage(self) -> None:
+        """Update plan usage counters.
+
+        While the background refresher is running, only the in-memory
+        baseline it maintains is folded back into the stats - zero I/O
+        on the UI refresh path. Sync contexts (init, summary) fall back
+        to an inline refresh.
+        """
+        if self._plan_usage_task is None:
+            self._refresh_plan_usage()
+            return
+
+        stats = self.stats
+        total = self._plan_baseline
+        stats.plan_messages_used = total
+        if stats.plan_messages_limit > 0:
+            stats.plan_usage_pct = min(100.0, (total / stats.plan_messages_limit) * 100)
+
+    def _refresh_plan_usage(self) -> None:
         """Update plan usage based on combined Claude Code and Ralph activity."""
-        # Use session turns as a proxy for messages used in this session
-        # Each iteration start counts as 1 turn, plus any additional turns during execution
-        session_messages = max(self.stats.iteration, self.stats.session_turns)
-        
         # Get baseline from Claude Code's official stats-cache
         claude_code_messages = 0
         try:
-            import json
-            from pathlib import Path
-            
             stats_path = Path.home() / ".claude" / "stats-cache.json"
-            if stats_path.exists():
+            if time.time() >= self._today_key_expires:
+                d = datetime.now()
+                self._today_key = d.strftime("%Y-%m-%d")
+                midnight = d.replace(hour=0, minute=0, second=0, microsecond=0)
+                self._today_key_expires = (midnight + timedelta(days=1)).timestamp()
+            today = self._today_key
+            try:
+                mtime = stats_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = 0
+
+            if mtime and mtime != self._stats_cache_mtime:
+                # File changed - parse once into a date-keyed dict
                 stats = json.loads(stats_path.read_text())
-                daily_activity = stats.get("dailyActivity", [])
-                today = datetime.now().strftime("%Y-%m-%d")
-                
-                for day in daily_activity:
-                    if day.get("date") == today:
-                        claude_code_messages = day.get("messageCount", 0)
-                        break
+                self._daily_msg_counts = {
+                    day.get("date"): day.get("messageCount", 0)
+                    for day in stats.get("dailyActivity", [])
+                }
+                self._stats_cache_mtime = mtime
+
+            claude_code_messages = self._daily_msg_counts.get(today, 0)
         except Exception:
             pass
             
         # Get baseline from Ralph's persistent usage tracking
-        from ..cli.registry import get_today_usage
-        ralph_persistent_messages = get_today_usage()
+        ralph_persistent_messages = self._get_today_usage()
         
         # Total = Official Claude Code + Ralph Persistent
         # Note: ralph_persistent_messages includes current session usage via track_usage()
         total_messages = claude_code_messages + ralph_persistent_messages
+        self._plan_baseline = total_messages
         self.stats.plan_messages_used = total_messages
         
         if self.stats.plan_messages_limit > 0:
@@ -374,7 +531,6 @@ class AgentDisplay:
         
         # Estimate reset time (5-hour rolling window from first session start)
         if not self.stats.plan_reset_time and self.stats.iteration_start_time:
-            from datetime import timedelta
             self.stats.plan_reset_time = self.stats.iteration_start_time + timedelta(hours=5)
     
     def log_activity(
@@ -384,118 +540,102 @@ class AgentDisplay:
         detail: str = "",
     ) -> None:
         """Log an activity entry."""
-        icon = self.ICONS.get(icon_key, "•")
-        self.activities.append(ActivityLog(
-            timestamp=datetime.now(),
-            icon=icon,
-            message=message,
-            detail=detail,
-        ))
-        
-        # Trim old activities
-        if len(self.activities) > self.max_activities:
-            self.activities = self.activities[-self.max_activities:]
-        
+        with self._act_lock:
+            self._act_timestamps.append(datetime.now())
+            self._act_icons.append(self.ICONS.get(icon_key, "•"))
+            self._act_messages.append(message)
+            self._act_details.append(detail)
+
+        self._mark_dirty("activities")
         self.refresh()
     
     def log_tool_use(self, tool_name: str, tool_input: dict) -> None:
         """Log a tool use event."""
-        icon_key = self._get_tool_icon(tool_name)
-        detail = self._format_tool_input(tool_name, tool_input)
+        icon_key, fmt = self._TOOL_FORMATTERS.get(tool_name, self._DEFAULT_FORMATTER)
+        detail = fmt(tool_input, self._tool_detail_max_len) if tool_input else ""
         self.log_activity(icon_key, tool_name, detail)
     
     def log_thinking(self, text: str) -> None:
         """Log agent thinking/reasoning."""
-        # Clean up the text - remove extra whitespace and newlines
-        cleaned = " ".join(text.split())
+        # Slice before normalizing so arbitrarily long blocks cost a
+        # bounded amount of work, then collapse whitespace in one pass
+        cleaned = _WS_RE.sub(" ", text[:360]).strip()
         truncated = cleaned[:120] + "..." if len(cleaned) > 120 else cleaned
         self.log_activity("thinking", truncated)
-    
+
     def log_text(self, text: str) -> None:
         """Log agent text output."""
-        # Clean up the text - remove extra whitespace and newlines
-        cleaned = " ".join(text.split())
+        cleaned = _WS_RE.sub(" ", text[:450]).strip()
         truncated = cleaned[:150] + "..." if len(cleaned) > 150 else cleaned
         self.log_activity("info", truncated)
     
-    def _get_tool_icon(self, tool_name: str) -> str:
-        """Get icon key for a tool."""
-        tool_icons = {
-            "Read": "file_read",
-            "Write": "file_write",
-            "Edit": "file_write",
-            "Bash": "bash",
-            "Glob": "search",
-            "Grep": "search",
-            "TodoWrite": "task",
-        }
-        return tool_icons.get(tool_name, "tool")
-    
-    def _format_tool_input(self, tool_name: str, tool_input: Optional[dict]) -> str:
-        """Format tool input for display."""
-        if not tool_input:
-            return ""
-        
-        # Calculate max detail length based on panel width
-        max_len = int(self.panel_width * 0.4)
-            
-        if tool_name == "Read":
-            path = tool_input.get("file_path", "")
-            return self._truncate_path(path, max_len)
-        elif tool_name in ("Write", "Edit"):
-            path = tool_input.get("file_path", "")
-            return self._truncate_path(path, max_len)
-        elif tool_name == "Bash":
-            cmd = tool_input.get("command", "")
-            # Clean up command - remove newlines
-            cmd = " ".join(cmd.split())
-            return cmd[:max_len] + "..." if len(cmd) > max_len else cmd
-        elif tool_name == "Glob":
-            pattern = tool_input.get("pattern", "")
-            return pattern[:max_len] if len(pattern) <= max_len else pattern[:max_len-3] + "..."
-        elif tool_name == "Grep":
-            pattern = tool_input.get("pattern", "")
-            return f'"{pattern[:max_len-4]}..."' if len(pattern) > max_len-2 else f'"{pattern}"'
-        elif tool_name == "TodoWrite":
-            return "(updating task list)"
-        return ""
-    
-    def _truncate_path(self, path: str, max_len: int) -> str:
-        """Truncate a file path intelligently, keeping the filename visible."""
-        if len(path) <= max_len:
-            return path
-        
-        # Try to show .../<last_two_components>
-        parts = path.split("/")
-        if len(parts) >= 2:
-            suffix = "/".join(parts[-2:])
-            if len(suffix) + 4 <= max_len:
-                return ".../" + suffix
-        
-        # Just truncate from the beginning
-        return "..." + path[-(max_len-3):]
-    
+    def _mark_dirty(self, section: str) -> None:
+        """Flag a render section for rebuild on the next refresh."""
+        self._dirty[section] = True
+
+    def _section(self, name: str, builder) -> object:
+        """Return the cached render for a section, rebuilding if dirty."""
+        if self._dirty.get(name, True):
+            self._render_cache[name] = builder()
+            self._dirty[name] = False
+        return self._render_cache[name]
+
     def _render(self) -> Panel:
-        """Render the full display."""
+        """Render the full display.
+
+        Header/task/activity sections are rebuilt only when their inputs
+        changed (dirty bits set by the mutators); the stats footer always
+        rebuilds since it shows live elapsed time.
+        """
         # Header
         mode_label = {
             "loop": "AFK Loop",
             "once": "Single Iteration",
             "spec": "Spec Discovery",
         }.get(self.mode, self.mode)
-        
+
         # Build title
         title = f" Ralph Agent - {mode_label} "
-        
+
         # Build content - single column layout for simplicity
         content = Table.grid(padding=(0, 1), expand=True)
         content.add_column(ratio=1)  # Full width single column
-        
+
+        content.add_row(self._section("header", self._render_header))
+        content.add_row()
+
+        # Task row (full width)
+        content.add_row(self._section("task", self._render_task))
+        content.add_row()
+
+        # Activity log (full width, no nested panel)
+        content.add_row(self._section("activities", self._render_activities))
+        content.add_row()
+
+        # Stats footer (one clock read shared by its time computations)
+        stats_text = self._render_stats(datetime.now())
+        content.add_row(stats_text)
+
+        # Controls hint if in loop mode (only on Unix where keyboard handling works)
+        if self.mode == "loop" and self.stats.total_iterations > 1 and _KEYBOARD_SUPPORTED:
+            content.add_row()
+            content.add_row(self._section("controls", self._render_controls))
+
+        return Panel(
+            content,
+            title=title,
+            border_style="cyan",
+            box=ROUNDED,
+            width=self.panel_width,
+        )
+
+    def _render_header(self) -> Table:
+        """Render the iteration/status header row."""
         # Header row with iteration and status
         header = Table.grid(expand=True)
         header.add_column(justify="left", ratio=1)
         header.add_column(justify="right", ratio=1)
-        
+
         if self.stats.total_iterations > 0:
             iter_text = Text()
             iter_text.append("ITERATION ", style="bold white")
@@ -535,57 +675,34 @@ class AgentDisplay:
                 header.add_row(exchange_text, status_text)
             else:
                 header.add_row(Text(), status_text)
-        
-        content.add_row(header)
-        content.add_row()
-        
-        # Task row (full width)
+
+        return header
+
+    def _render_task(self) -> Text:
+        """Render the current task/topic row."""
         task_text = Text()
         label = "TOPIC " if self.mode == "spec" else "TASK "
         task_text.append(label, style="bold white")
         if self.stats.current_task_id:
             task_text.append(f"[{self.stats.current_task_id}] ", style="bold yellow")
-        
+
         default_msg = "(analyzing...)" if self.mode == "spec" else "(reading requirements...)"
         task_text.append(
             self.stats.current_task or default_msg,
             style="cyan" if self.stats.current_task else "dim"
         )
-        content.add_row(task_text)
-        content.add_row()
-        
-        # Activity log (full width, no nested panel)
-        activity_table = self._render_activities()
-        content.add_row(activity_table)
-        content.add_row()
-        
-        # Stats footer
-        stats_text = self._render_stats()
-        content.add_row(stats_text)
-        
-        # Controls hint if in loop mode (only on Unix where keyboard handling works)
-        if self.mode == "loop" and self.stats.total_iterations > 1 and _KEYBOARD_SUPPORTED:
-            content.add_row()
-            hint_text = Text()
-            hint_text.append("CONTROLS ", style="bold white")
-            hint_text.append("[p]", style="bold cyan")
-            hint_text.append(" pause  ", style="dim")
-            hint_text.append("[i]", style="bold magenta")
-            hint_text.append(" intervene  ", style="dim")
-            hint_text.append("[g]", style="bold yellow")
-            hint_text.append(" gutter  ", style="dim")
-            hint_text.append("[s]", style="bold red")
-            hint_text.append(" stop", style="dim")
-            content.add_row(hint_text)
-        
-        return Panel(
-            content,
-            title=title,
-            border_style="cyan",
-            box=ROUNDED,
-            width=self.panel_width,
+        return task_text
+
+    def _render_controls(self) -> Text:
+        """Render the (static) keyboard controls hint."""
+        return Text.from_markup(
+            "[bold white]CONTROLS [/]"
+            "[bold cyan]\\[p][/][dim] pause  [/]"
+            "[bold magenta]\\[i][/][dim] intervene  [/]"
+            "[bold yellow]\\[g][/][dim] gutter  [/]"
+            "[bold red]\\[s][/][dim] stop[/]"
         )
-    
+
     def _render_activities(self) -> Table:
         """Render the activity log section - FULL width, no nested panel."""
         # Single column table for clean layout - will expand to fill parent
@@ -594,39 +711,47 @@ class AgentDisplay:
         table.add_column(ratio=1)
         
         # Activity header - Minimalist separator
-        header = Text()
-        header.append("─" * 4 + " ", style="blue")
-        header.append("ACTIVITY", style="bold blue")
-        header.append(" " + "─" * (self.panel_width - 16), style="blue")
-        table.add_row(header)
+        table.add_row(Text.from_markup(self._activity_header))
         
         max_lines = self.ACTIVITY_PANEL_HEIGHT
-        
+
+        # Snapshot under the lock: this runs on Live's refresh thread
+        # while the event loop keeps appending
+        with self._act_lock:
+            icons = list(self._act_icons)
+            messages = list(self._act_messages)
+            details = list(self._act_details)
+
         # Add placeholder if no activities
-        if not self.activities:
+        if not icons:
             table.add_row(Text("  Waiting for agent activity...", style="dim italic"))
             line_count = 1
         else:
             line_count = 0
-            
-            # Show most recent activities that fit
-            displayed_activities = self.activities[-max_lines:]
-            
-            for activity in displayed_activities:
+
+            # Show most recent activities that fit (tail of the log)
+            start = max(0, len(icons) - max_lines)
+            displayed_activities = zip(
+                icons[start:],
+                messages[start:],
+                details[start:],
+            )
+
+            for icon, message, detail in displayed_activities:
                 # Tool activities (with detail) - single line, truncate if needed
-                if activity.detail:
+                if detail:
                     line = Text(overflow="ellipsis", no_wrap=True)
-                    line.append(f"{activity.icon} ", style="white")
-                    line.append(activity.message, style="white")
+                    line.append(f"{icon} ", style="white")
+                    line.append(message, style="white")
                     line.append(":  ", style="dim")
-                    line.append(activity.detail, style="dim")
+                    line.append(detail, style="dim")
                     table.add_row(line)
                     line_count += 1
                 else:
                     # Thinking/reasoning messages - allow full display, no truncation
                     line = Text()
-                    line.append(f"{activity.icon} ", style="white")
-                    line.append(activity.message, style="italic dim white")
+                    line.append(f"{icon} ", style="white")
+                    line.append(message, style="italic dim white")
                     table.add_row(line)
                     line_count += 1
         
@@ -637,80 +762,87 @@ class AgentDisplay:
         
         return table
     
-    def _render_stats(self) -> Text:
-        """Render the statistics line."""
-        text = Text()
-        
+    def _render_stats(self, now: Optional[datetime] = None) -> Text:
+        """Render the statistics line.
+
+        Args:
+            now: Current time, taken once per render to avoid repeated
+                clock reads; defaults to datetime.now() for direct calls.
+        """
+        if now is None:
+            now = datetime.now()
+        stats = self.stats
+
         # Plan usage progress bar (first, most important)
-        plan_pct = self.stats.plan_usage_pct
+        plan_pct = stats.plan_usage_pct
         plan_color = "green"
         if plan_pct > 80:
             plan_color = "red"
         elif plan_pct > 60:
             plan_color = "yellow"
-        
-        # Build progress bar with elegant minimalist block
+
+        # Build progress bar by slicing the precomputed template - one
+        # allocation instead of two repeats plus a concat
         bar_width = 20
         filled = int(bar_width * plan_pct / 100)
-        empty = bar_width - filled
-        bar = "█" * filled + "░" * empty
-        
-        text.append("PLAN ", style="bold white")
-        text.append(f"[{bar}]", style=f"{plan_color}")
-        text.append(f" {plan_pct:.0f}%", style=f"bold {plan_color}")
-        text.append(f" ({self.stats.plan_messages_used}/{self.stats.plan_messages_limit})", style="dim")
-        
+        bar = self._FULL_BAR[bar_width - filled:2 * bar_width - filled]
+
+        # Assembled as one markup string parsed in a single pass instead
+        # of ~25 Text.append calls (each allocates a Span)
+        parts = [
+            f"[bold white]PLAN [/][{plan_color}]\\[{bar}][/]"
+            f"[bold {plan_color}] {plan_pct:.0f}%[/]"
+            f"[dim] ({stats.plan_messages_used}/{stats.plan_messages_limit})[/]"
+        ]
+
         # Show reset time if available
-        if self.stats.plan_reset_time:
-            time_left = self.stats.plan_reset_time - datetime.now()
-            if time_left.total_seconds() > 0:
-                hours = int(time_left.total_seconds() // 3600)
-                mins = int((time_left.total_seconds() % 3600) // 60)
-                text.append(f"  {hours}h {mins}m to reset", style="dim italic")
-        text.append("\n")
-        
+        if stats.plan_reset_time:
+            time_left = (stats.plan_reset_time - now).total_seconds()
+            if time_left > 0:
+                hours = int(time_left // 3600)
+                mins = int((time_left % 3600) // 60)
+                parts.append(f"[dim italic]  {hours}h {mins}m to reset[/]")
+        parts.append("\n")
+
         # Context health indicator
         health_color = "green"
-        if self.stats.context_used_pct > 80:
+        if stats.context_used_pct > 80:
             health_color = "red"
-        elif self.stats.context_used_pct > 60:
+        elif stats.context_used_pct > 60:
             health_color = "yellow"
-            
+
         # Current iteration stats
-        tokens = f"{self.stats.input_tokens:,} in / {self.stats.output_tokens:,} out"
-        cost = f"${self.stats.total_cost_usd:.2f}" if self.stats.total_cost_usd else "$0.00"
-        
+        tokens = f"{stats.input_tokens:,} in / {stats.output_tokens:,} out"
+        cost = f"${stats.total_cost_usd:.2f}" if stats.total_cost_usd else "$0.00"
+
         # Real-time elapsed time
-        if self.stats.iteration_start_time:
-            elapsed = (datetime.now() - self.stats.iteration_start_time).total_seconds()
+        if stats.iteration_start_time:
+            elapsed = (now - stats.iteration_start_time).total_seconds()
             duration = f"{elapsed:.0f}s"
-        elif self.stats.duration_ms:
-            duration = f"{self.stats.duration_ms / 1000:.1f}s"
+        elif stats.duration_ms:
+            duration = f"{stats.duration_ms / 1000:.1f}s"
         else:
             duration = "0s"
-        
-        text.append("CONTEXT ", style="bold white")
-        text.append(f"{self.stats.context_used_pct:.1f}%", style=f"bold {health_color}")
-        text.append(f" ({self.stats.context_used_tokens:,}/{self.stats.context_limit:,})", style="dim")
-        text.append("\n")
-        
-        text.append("TOKENS ", style="bold white")
-        text.append(f"{tokens:<25}", style="cyan")
-        text.append("COST ", style="bold white")
-        text.append(f"{cost:<10}", style="green")
-        text.append("TIME ", style="bold white")
-        text.append(duration, style="yellow")
-        
+
+        parts.append(
+            f"[bold white]CONTEXT [/][bold {health_color}]{stats.context_used_pct:.1f}%[/]"
+            f"[dim] ({stats.context_used_tokens:,}/{stats.context_limit:,})[/]\n"
+            f"[bold white]TOKENS [/][cyan]{tokens:<25}[/]"
+            f"[bold white]COST [/][green]{cost:<10}[/]"
+            f"[bold white]TIME [/][yellow]{duration}[/]"
+        )
+
         # Add cumulative if multiple iterations
-        if self.stats.iteration > 1 and self.mode != "spec":
-            text.append("\n")
-            text.append("CUMULATIVE ", style="bold dim")
-            cum_tokens = f"{self.stats.cumulative_input_tokens:,} in / {self.stats.cumulative_output_tokens:,} out"
-            cum_cost = f"${self.stats.cumulative_cost_usd:.2f}"
-            cum_time = f"{self.stats.cumulative_duration_ms / 1000:.1f}s"
-            text.append(f"{cum_tokens}  |  {cum_cost}  |  {cum_time}", style="dim")
-        
-        return text
+        if stats.iteration > 1 and self.mode != "spec":
+            cum_tokens = f"{stats.cumulative_input_tokens:,} in / {stats.cumulative_output_tokens:,} out"
+            cum_cost = f"${stats.cumulative_cost_usd:.2f}"
+            cum_time = f"{stats.cumulative_duration_ms / 1000:.1f}s"
+            parts.append(
+                f"\n[bold dim]CUMULATIVE [/]"
+                f"[dim]{cum_tokens}  |  {cum_cost}  |  {cum_time}[/]"
+            )
+
+        return Text.from_markup("".join(parts))
     
     def print_summary(self) -> None:
         """Print final summary after run completes."""
@@ -1,127 +1,284 @@
 """Permission handlers for restricting agent file access."""
 
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
 from claude_agent_sdk.types import PermissionResultAllow, PermissionResultDeny
 
 logger = logging.getLogger(__name__)
 
 
-def create_project_permission_handler(project_path: Path):
-    """Create a permission handler that restricts file access to project directory.
-    
+# parent dir -> its realpath. Tool calls cluster in a handful of
+# directories, so each one is resolved once instead of per call. These
+# handlers deny symlink creation in the restricted modes (no Bash), so
+# entries can't go stale within a session.
+_DIR_REALPATHS: dict[str, str] = {}
+
+
+def _normalize(file_path: str, base_str: str) -> str:
+    """Normalize a tool path against a base directory, cheaply.
+
+    Path.resolve() stats every component on every call. A lexical
+    normpath can be fooled by symlinks anywhere in the path, so the
+    parent directory is realpath'd once (cached per directory) and the
+    leaf additionally resolved when it is itself a symlink.
+    """
+    abs_path = file_path if os.path.isabs(file_path) else os.path.join(base_str, file_path)
+    norm = os.path.normpath(abs_path)
+    head, tail = os.path.split(norm)
+    real_head = _DIR_REALPATHS.get(head)
+    if real_head is None:
+        real_head = os.path.realpath(head)
+        _DIR_REALPATHS[head] = real_head
+    if real_head != head:
+        norm = os.path.join(real_head, tail)
+    if os.path.islink(norm):
+        norm = os.path.realpath(norm)
+    return norm
+
+
+def _is_within(norm: str, root_str: str) -> bool:
+    """Check containment by string prefix on normalized paths."""
+    return norm == root_str or norm.startswith(root_str + os.sep)
+
+
+def _root_str(path: Path) -> str:
+    """Stringify an allowed-root directory for prefix checks.
+
+    Callers (SpecSession, the CLI) already resolve their directories
+    once up front, so an absolute path only needs a lexical normpath
+    here - Path.resolve() would stat the whole chain again.
+    """
+    if path.is_absolute():
+        return os.path.normpath(str(path))
+    return str(path.resolve())
+
+
+# tool_name -> input key holding the path. "path" tools (Glob/Grep)
+# default to the handler's root directory when the key is absent.
+_PATH_KEY = {
+    "Read": "file_path",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "Glob": "path",
+    "Grep": "path",
+}
+
+# Tool groups, hoisted so the hot handlers don't rebuild a set per call
+_FILE_TOOLS = frozenset({"Read", "Write", "Edit", "Glob", "Grep"})
+_READONLY_TOOLS = frozenset({"Read", "Glob", "Grep"})
+_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+# Shared allow result for the common no-mutation case: updated_input=None
+# means "input unchanged", so one instance serves every pass-through
+# instead of allocating a result object per tool call.
+_ALLOW_PASSTHROUGH = PermissionResultAllow()
+
+# Tools commonly requested but denied in restricted modes. Denials for
+# these are prebuilt at factory time so a loopy agent hammering a
+# blocked tool doesn't pay f-string formatting + allocation per call.
+_COMMON_DENIED_TOOLS = (
+    "Bash",
+    "Write",
+    "Edit",
+    "TodoWrite",
+    "WebFetch",
+    "WebSearch",
+    "Task",
+    "NotebookEdit",
+)
+
+
+def _make_handler(
+    read_roots: tuple[str, ...],
+    write_roots: tuple[str, ...] = (),
+    question_handler: Optional[Callable[[list[dict]], dict[str, str]]] = None,
+    allow_nonfile: bool = False,
+    rewrite_write_path: bool = False,
+    read_deny_template: str = "Access denied: {path} is outside project directory",
+    write_deny_template: str = "Access denied: {path} is outside project directory",
+    tool_deny_template: str = "Tool '{tool}' not allowed",
+):
+    """Build a permission handler from allowed read/write roots.
+
+    All four permission modes share the same path extraction and
+    containment logic; this single factory keeps that hot path in one
+    place, and the public ``create_*`` functions below are thin wrappers
+    passing mode-specific roots, flags, and denial wording.
+
     Args:
-        project_path: The project directory to allow access to
-    
+        read_roots: Directories Read/Glob/Grep may access. The first
+            entry is also the base for resolving relative paths and the
+            default for Glob/Grep when no path is given.
+        write_roots: Directories Write/Edit may target. Empty means
+            write tools are denied via ``tool_deny_template``.
+        question_handler: If set, AskUserQuestion is answered through
+            this callback (HITL).
+        allow_nonfile: Whether tools outside the file set pass through
+            (coding mode) or are denied (spec/plan modes).
+        rewrite_write_path: Rewrite allowed writes to the normalized
+            absolute path, so relative writes land in write_roots[0].
+        read_deny_template: Denial message for out-of-bounds reads;
+            ``{path}`` is substituted.
+        write_deny_template: Denial message for out-of-bounds writes;
+            ``{path}`` is substituted.
+        tool_deny_template: Denial message for disallowed tools;
+            ``{tool}`` is substituted.
+
     Returns:
         Async permission handler function for can_use_tool
     """
-    project_path = project_path.resolve()
-    
+    base_str = read_roots[0]
+    write_base = write_roots[0] if write_roots else base_str
+
+    # Prebuild denials for the usual suspects; the dynamic path below
+    # still covers any tool name outside this list
+    static_denies: dict[str, PermissionResultDeny] = {}
+    if not allow_nonfile:
+        for tool in _COMMON_DENIED_TOOLS:
+            if write_roots and tool in _WRITE_TOOLS:
+                continue
+            static_denies[tool] = PermissionResultDeny(
+                message=tool_deny_template.format(tool=tool),
+                interrupt=False,
+            )
+
     async def permission_handler(
         tool_name: str,
         input_data: dict,
         context: dict,
     ) -> Union[PermissionResultAllow, PermissionResultDeny]:
-        """Check if tool access is within project bounds."""
-        
-        # Tools that access files
-        file_tools = {"Read", "Write", "Edit", "Glob", "Grep"}
-        
-        if tool_name not in file_tools:
-            # Allow non-file tools
-            return PermissionResultAllow(updated_input=input_data)
-        
-        # Get the file path from input
-        file_path = None
-        if tool_name == "Read":
-            file_path = input_data.get("file_path")
-        elif tool_name in ("Write", "Edit"):
+        """Check tool access against the configured roots."""
+
+        # Tool names arrive as fresh strings off the wire; interning
+        # lets the set/dict lookups below short-circuit on identity
+        tool_name = sys.intern(tool_name)
+
+        # Common case first: read-only tools dominate tool traffic
+        if tool_name in _READONLY_TOOLS:
+            key = _PATH_KEY[tool_name]
+            file_path = input_data.get(key)
+            if not file_path and key == "path":
+                file_path = base_str
+
+            if file_path:
+                norm = _normalize(file_path, base_str)
+                for root in read_roots:
+                    if _is_within(norm, root):
+                        break
+                else:
+                    return PermissionResultDeny(
+                        message=read_deny_template.format(path=file_path),
+                        interrupt=False,  # Don't stop the agent, just deny this action
+                    )
+
+            return _ALLOW_PASSTHROUGH
+
+        if tool_name in _WRITE_TOOLS:
+            if not write_roots:
+                deny = static_denies.get(tool_name)
+                if deny is None:
+                    deny = PermissionResultDeny(
+                        message=tool_deny_template.format(tool=tool_name),
+                        interrupt=False,
+                    )
+                return deny
+
             file_path = input_data.get("file_path")
-        elif tool_name == "Glob":
-            file_path = input_data.get("path") or str(project_path)
-        elif tool_name == "Grep":
-            file_path = input_data.get("path") or str(project_path)
-        
-        if file_path:
-            # Resolve the path
-            target_path = Path(file_path)
-            if not target_path.is_absolute():
-                target_path = project_path / target_path
-            target_path = target_path.resolve()
-            
-            # Check if path is within project
-            try:
-                target_path.relative_to(project_path)
-            except ValueError:
-                # Path is outside project directory
+            if file_path:
+                # Relative writes resolve against the write base
+                norm = _normalize(file_path, write_base)
+                for root in write_roots:
+                    if _is_within(norm, root):
+                        if rewrite_write_path:
+                            # Update input to use the absolute path
+                            return PermissionResultAllow(
+                                updated_input=dict(input_data, file_path=norm)
+                            )
+                        return _ALLOW_PASSTHROUGH
+
+                logger.warning(f"Blocked write to {file_path} - outside allowed directories")
+                return PermissionResultDeny(
+                    message=write_deny_template.format(path=file_path),
+                    interrupt=False,
+                )
+
+            if rewrite_write_path:
+                # Spec mode requires an explicit target path
                 return PermissionResultDeny(
-                    message=f"Access denied: {file_path} is outside project directory ({project_path})",
-                    interrupt=False,  # Don't stop the agent, just deny this action
+                    message="Write denied: No file path specified",
+                    interrupt=False,
                 )
-        
-        return PermissionResultAllow(updated_input=input_data)
-    
+            return _ALLOW_PASSTHROUGH
+
+        # AskUserQuestion - the HITL mechanism, when a handler is wired up
+        if tool_name == "AskUserQuestion" and question_handler is not None:
+            # No default - None and [] are both falsy, and skipping the
+            # default avoids allocating a throwaway list on misses
+            questions = input_data.get("questions")
+            if questions:
+                # Call the question handler to get user answers
+                answers = question_handler(questions)
+                # Return updated input with answers populated
+                return PermissionResultAllow(updated_input=dict(input_data, answers=answers))
+            return _ALLOW_PASSTHROUGH
+
+        if allow_nonfile:
+            return _ALLOW_PASSTHROUGH
+
+        deny = static_denies.get(tool_name)
+        if deny is None:
+            deny = PermissionResultDeny(
+                message=tool_deny_template.format(tool=tool_name),
+                interrupt=False,
+            )
+        return deny
+
     return permission_handler
 
 
+def create_project_permission_handler(project_path: Path):
+    """Create a permission handler that restricts file access to project directory.
+
+    Args:
+        project_path: The project directory to allow access to
+
+    Returns:
+        Async permission handler function for can_use_tool
+    """
+    project_str = _root_str(project_path)
+    return _make_handler(
+        read_roots=(project_str,),
+        write_roots=(project_str,),
+        allow_nonfile=True,
+        read_deny_template=(
+            "Access denied: {path} is outside project directory (" + project_str + ")"
+        ),
+        write_deny_template=(
+            "Access denied: {path} is outside project directory (" + project_str + ")"
+        ),
+    )
+
+
 def create_readonly_permission_handler(project_path: Path):
     """Create a permission handler for read-only (plan) mode.
-    
+
     Only allows Read, Glob, Grep within project directory.
-    
+
     Args:
         project_path: The project directory to allow access to
-    
+
     Returns:
         Async permission handler function for can_use_tool
     """
-    project_path = project_path.resolve()
-    
-    async def permission_handler(
-        tool_name: str,
-        input_data: dict,
-        context: dict,
-    ) -> Union[PermissionResultAllow, PermissionResultDeny]:
-        """Check if tool is read-only and within project bounds."""
-        
-        # Only allow read-only tools
-        readonly_tools = {"Read", "Glob", "Grep"}
-        
-        if tool_name not in readonly_tools:
-            return PermissionResultDeny(
-                message=f"Tool '{tool_name}' not allowed in read-only mode",
-                interrupt=False,
-            )
-        
-        # Get the file path from input
-        file_path = None
-        if tool_name == "Read":
-            file_path = input_data.get("file_path")
-        elif tool_name == "Glob":
-            file_path = input_data.get("path") or str(project_path)
-        elif tool_name == "Grep":
-            file_path = input_data.get("path") or str(project_path)
-        
-        if file_path:
-            target_path = Path(file_path)
-            if not target_path.is_absolute():
-                target_path = project_path / target_path
-            target_path = target_path.resolve()
-            
-            try:
-                target_path.relative_to(project_path)
-            except ValueError:
-                return PermissionResultDeny(
-                    message=f"Access denied: {file_path} is outside project directory",
-                    interrupt=False,
-                )
-        
-        return PermissionResultAllow(updated_input=input_data)
-    
-    return permission_handler
+    project_str = _root_str(project_path)
+    return _make_handler(
+        read_roots=(project_str,),
+        tool_deny_template="Tool '{tool}' not allowed in read-only mode",
+    )
 
 
 def create_interactive_permission_handler(
@@ -129,177 +286,55 @@ def create_interactive_permission_handler(
     question_handler: Callable[[list[dict]], dict[str, str]],
 ):
     """Create a permission handler for interactive spec mode with HITL support.
-    
+
     Allows read-only tools plus AskUserQuestion for human-in-the-loop interaction.
-    
+
     Args:
         project_path: The project directory to allow access to
         question_handler: Callback that receives questions and returns answers
             - Input: list of question dicts with 'question', 'header', 'options', 'multiSelect'
             - Output: dict mapping question text to answer string
-    
+
     Returns:
         Async permission handler function for can_use_tool
     """
-    project_path = project_path.resolve()
-    
-    async def permission_handler(
-        tool_name: str,
-        input_data: dict,
-        context: dict,
-    ) -> Union[PermissionResultAllow, PermissionResultDeny]:
-        """Handle permissions for interactive spec mode."""
-        
-        # Handle AskUserQuestion - this is the HITL mechanism
-        if tool_name == "AskUserQuestion":
-            questions = input_data.get("questions", [])
-            if questions:
-                # Call the question handler to get user answers
-                answers = question_handler(questions)
-                # Return updated input with answers populated
-                updated_input = {**input_data, "answers": answers}
-                return PermissionResultAllow(updated_input=updated_input)
-            return PermissionResultAllow(updated_input=input_data)
-        
-        # Only allow read-only tools (plus AskUserQuestion handled above)
-        readonly_tools = {"Read", "Glob", "Grep"}
-        
-        if tool_name not in readonly_tools:
-            return PermissionResultDeny(
-                message=f"Tool '{tool_name}' not allowed in spec mode",
-                interrupt=False,
-            )
-        
-        # Check file paths are within project
-        file_path = None
-        if tool_name == "Read":
-            file_path = input_data.get("file_path")
-        elif tool_name == "Glob":
-            file_path = input_data.get("path") or str(project_path)
-        elif tool_name == "Grep":
-            file_path = input_data.get("path") or str(project_path)
-        
-        if file_path:
-            target_path = Path(file_path)
-            if not target_path.is_absolute():
-                target_path = project_path / target_path
-            target_path = target_path.resolve()
-            
-            try:
-                target_path.relative_to(project_path)
-            except ValueError:
-                return PermissionResultDeny(
-                    message=f"Access denied: {file_path} is outside project directory",
-                    interrupt=False,
-                )
-        
-        return PermissionResultAllow(updated_input=input_data)
-    
-    return permission_handler
+    project_str = _root_str(project_path)
+    return _make_handler(
+        read_roots=(project_str,),
+        question_handler=question_handler,
+        tool_deny_template="Tool '{tool}' not allowed in spec mode",
+    )
 
 
 def create_spec_permission_handler(target_dir: Path, workspace_dir: Path):
     """Create a permission handler for spec discovery mode.
-    
+
     During spec discovery:
     - READ operations allowed from target_dir (to understand the project)
     - WRITE/EDIT operations ONLY allowed to workspace_dir (spec files)
     - NO files should be created in the target project
     - Bash, TodoWrite, and other tools are NOT allowed
-    
+
     Args:
         target_dir: The target project directory (read-only)
         workspace_dir: Ralph's workspace directory (write allowed)
-    
+
     Returns:
         Async permission handler function for can_use_tool
     """
-    target_dir = target_dir.resolve()
-    workspace_dir = workspace_dir.resolve()
-    
-    async def permission_handler(
-        tool_name: str,
-        input_data: dict,
-        context: dict,
-    ) -> Union[PermissionResultAllow, PermissionResultDeny]:
-        """Handle permissions for spec discovery mode."""
-        
-        # Read-only tools - allow from target directory
-        read_tools = {"Read", "Glob", "Grep"}
-        
-        # Write tools - only allow to workspace
-        write_tools = {"Write", "Edit"}
-        
-        # Handle read tools
-        if tool_name in read_tools:
-            file_path = None
-            if tool_name == "Read":
-                file_path = input_data.get("file_path")
-            elif tool_name == "Glob":
-                file_path = input_data.get("path") or str(target_dir)
-            elif tool_name == "Grep":
-                file_path = input_data.get("path") or str(target_dir)
-            
-            if file_path:
-                path = Path(file_path)
-                if not path.is_absolute():
-                    path = target_dir / path
-                path = path.resolve()
-                
-                # Allow reading from target_dir OR workspace_dir
-                try:
-                    path.relative_to(target_dir)
-                    return PermissionResultAllow(updated_input=input_data)
-                except ValueError:
-                    pass
-                
-                try:
-                    path.relative_to(workspace_dir)
-                    return PermissionResultAllow(updated_input=input_data)
-                except ValueError:
-                    pass
-                
-                return PermissionResultDeny(
-                    message=f"Read access denied: {file_path} is outside allowed directories",
-                    interrupt=False,
-                )
-            
-            return PermissionResultAllow(updated_input=input_data)
-        
-        # Handle write tools - ONLY allow to workspace
-        if tool_name in write_tools:
-            file_path = input_data.get("file_path")
-            
-            if file_path:
-                path = Path(file_path)
-                if not path.is_absolute():
-                    # Default writes should go to workspace
-                    path = workspace_dir / path
-                path = path.resolve()
-                
-                # Only allow writes to workspace directory
-                try:
-                    path.relative_to(workspace_dir)
-                    # Update input to use absolute workspace path
-                    updated_input = {**input_data, "file_path": str(path)}
-                    return PermissionResultAllow(updated_input=updated_input)
-                except ValueError:
-                    logger.warning(f"Blocked write to {file_path} - not in workspace")
-                    return PermissionResultDeny(
-                        message=f"Write denied: During spec discovery, files can only be written to the Ralph workspace. "
-                               f"Target: {file_path}. Allowed: {workspace_dir}",
-                        interrupt=False,
-                    )
-            
-            return PermissionResultDeny(
-                message="Write denied: No file path specified",
-                interrupt=False,
-            )
-        
-        # Deny other tools during spec discovery
-        # (Bash, TodoWrite, etc. should not be used)
-        return PermissionResultDeny(
-            message=f"Tool '{tool_name}' is not allowed during spec discovery. "
-                   f"Only Read, Glob, Grep, Write (to workspace), and Edit (workspace) are allowed.",
-            interrupt=False,
-        )
+    target_str = _root_str(target_dir)
+    workspace_str = _root_str(workspace_dir)
+    return _make_handler(
+        read_roots=(target_str, workspace_str),
+        write_roots=(workspace_str,),
+        rewrite_write_path=True,
+        read_deny_template="Read access denied: {path} is outside allowed directories",
+        write_deny_template=(
+            "Write denied: During spec discovery, files can only be written to the "
+            "Ralph workspace. Target: {path}. Allowed: " + workspace_str
+        ),
+        tool_deny_template=(
+            "Tool '{tool}' is not allowed during spec discovery. "
+            "Only Read, Glob, Grep, Write (to workspace), and Edit (workspace) are allowed."
+        ),
+    )
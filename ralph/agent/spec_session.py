@@ -7,6 +7,7 @@ this maintains a persistent Claude client and true back-and-forth conversation.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator, Callable, Optional
@@ -22,9 +23,19 @@ from claude_agent_sdk import (
 )
 
 from .output import AgentDisplay
+from .permissions import create_spec_permission_handler
 
 logger = logging.getLogger(__name__)
 
+# tool_name -> input field shown in the activity display
+_TOOL_DISPLAY_KEY = {
+    "Read": "file_path",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "Glob": "pattern",
+    "Grep": "pattern",
+}
+
 
 class SpecSession:
     """Manages a spec creation conversation with Claude.
@@ -78,6 +89,9 @@ class SpecSession:
         self.messages: list[dict] = []
         self.complete: bool = False
         self.created_at = datetime.now()
+        # Monotonic clock for durations - cheaper than datetime.now()
+        # and immune to wall-clock jumps
+        self._created_monotonic = time.monotonic()
         
         # Stats tracking
         self.total_input_tokens = 0
@@ -105,8 +119,6 @@ class SpecSession:
         Yields:
             Message chunks: {"type": "text"|"tool"|"thinking"|"complete", ...}
         """
-        from .permissions import create_spec_permission_handler
-        
         # Ensure workspace directory exists
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
         
@@ -189,54 +201,90 @@ class SpecSession:
             return
         
         await self.client.query(message)
-        
-        current_text = ""
-        
+
+        # Bind hot attributes to locals once; the block loop below runs
+        # per streamed chunk and instance attribute loads add up there
+        display = self.display
+
+        # Accumulate text chunks and join once - += on a growing string
+        # is quadratic, and one assistant entry per turn keeps
+        # self.messages from fragmenting into per-chunk records
+        text_parts: list[str] = []
+
+        # Scan for the completion signal incrementally: each chunk is
+        # checked once (with a small carry-over tail in case the signal
+        # straddles a chunk boundary) instead of rescanning the whole
+        # accumulated text at the end of the turn.
+        signal = self.SPEC_COMPLETE_SIGNAL
+        signal_tail_len = len(signal) - 1
+        signal_seen = False
+        signal_tail = ""
+
+        # Consecutive TextBlocks within a message are coalesced into a
+        # single yield: each yield is an event-loop round-trip plus a
+        # dict allocation, which dominates on rapid token streams. The
+        # buffer is flushed at thinking/tool boundaries so interleaved
+        # events still arrive in order.
+        pending_text: list[str] = []
+
         async for msg in self.client.receive_response():
-            msg_type = type(msg).__name__
-            
-            if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+            if isinstance(msg, AssistantMessage):
                 for block in msg.content:
-                    block_type = type(block).__name__
-                    
-                    if block_type == "TextBlock" and hasattr(block, "text"):
-                        text = block.text
-                        if text:
-                            current_text += text
-                            yield {"type": "text", "content": text}
-                            
-                            # Store in messages
-                            self.messages.append({
-                                "role": "assistant",
-                                "content": text,
-                                "timestamp": datetime.now().isoformat(),
-                            })
-                            
-                            # Log to display if available
-                            if self.display:
-                                self.display.log_text(text)
-                    
-                    elif block_type == "ThinkingBlock" and hasattr(block, "thinking"):
+                    if isinstance(block, TextBlock):
+                        if block.text:
+                            pending_text.append(block.text)
+                        continue
+
+                    if pending_text:
+                        text = "".join(pending_text)
+                        pending_text.clear()
+                        text_parts.append(text)
+                        if not signal_seen:
+                            window = signal_tail + text
+                            if signal in window:
+                                signal_seen = True
+                            else:
+                                signal_tail = window[-signal_tail_len:]
+                        yield {"type": "text", "content": text}
+                        if display:
+                            display.log_text(text)
+
+                    if isinstance(block, ThinkingBlock):
                         yield {"type": "thinking", "content": block.thinking}
-                        if self.display:
-                            self.display.log_thinking(block.thinking)
-                    
-                    elif block_type == "ToolUseBlock":
+                        if display:
+                            display.log_thinking(block.thinking)
+
+                    elif isinstance(block, ToolUseBlock):
                         # Yield tool information for streaming display
-                        tool_name = getattr(block, "name", "Tool")
-                        tool_input = getattr(block, "input", {})
-                        
+                        tool_name = block.name
+                        tool_input = block.input
+
                         # Format tool input for display
                         input_str = self._format_tool_input(tool_name, tool_input)
                         yield {"type": "tool", "name": tool_name, "input": input_str}
-                        
+
                         # Log to display if available
-                        if self.display:
-                            self.display.log_tool_use(tool_name, tool_input)
+                        if display:
+                            display.log_tool_use(tool_name, tool_input)
+
+                if pending_text:
+                    text = "".join(pending_text)
+                    pending_text.clear()
+                    text_parts.append(text)
+                    if not signal_seen:
+                        window = signal_tail + text
+                        if signal in window:
+                            signal_seen = True
+                        else:
+                            signal_tail = window[-signal_tail_len:]
+                    yield {"type": "text", "content": text}
+                    if display:
+                        display.log_text(text)
             
-            elif msg_type == "ResultMessage":
-                # Extract usage stats
-                usage = getattr(msg, "usage", None)
+            elif isinstance(msg, ResultMessage):
+                # Extract usage stats - ResultMessage defines these
+                # fields, so no getattr guards needed
+                usage = msg.usage
                 if usage:
                     # usage can be a dict or an object
                     if hasattr(usage, "get"):
@@ -245,17 +293,16 @@ class SpecSession:
                     else:
                         input_tokens = getattr(usage, "input_tokens", 0)
                         output_tokens = getattr(usage, "output_tokens", 0)
-                        
+
                     self.total_input_tokens += input_tokens
                     self.total_output_tokens += output_tokens
-                
-                cost = getattr(msg, "total_cost_usd", 0.0)
-                if cost:
-                    self.total_cost_usd += cost
+
+                if msg.total_cost_usd:
+                    self.total_cost_usd += msg.total_cost_usd
                 
                 # Update display stats if available
-                if self.display:
-                    self.display.update_stats(
+                if display:
+                    display.update_stats(
                         input_tokens=self.total_input_tokens,
                         output_tokens=self.total_output_tokens,
                         cost_usd=self.total_cost_usd,
@@ -263,29 +310,33 @@ class SpecSession:
                         context_limit=self.context_limit,
                     )
         
+        # Store one assistant entry for the whole turn
+        current_text = "".join(text_parts)
+        if current_text:
+            self.messages.append({
+                "role": "assistant",
+                "content": current_text,
+                "timestamp": datetime.now().isoformat(),
+            })
+
         # Check for completion signal
-        if self.SPEC_COMPLETE_SIGNAL in current_text:
+        if signal_seen:
             self.complete = True
             yield {"type": "complete", "content": "Spec discovery complete!"}
-            if self.display:
-                self.display.log_activity("complete", "Spec complete!")
+            if display:
+                display.log_activity("complete", "Spec complete!")
     
     def _format_tool_input(self, tool_name: str, tool_input: dict) -> str:
         """Format tool input for display."""
         if not tool_input:
             return ""
-            
-        if tool_name == "Read":
-            return tool_input.get("file_path", "")
-        elif tool_name in ("Write", "Edit"):
-            return tool_input.get("file_path", "")
-        elif tool_name == "Bash":
+
+        key = _TOOL_DISPLAY_KEY.get(tool_name)
+        if key:
+            return tool_input.get(key, "")
+        if tool_name == "Bash":
             cmd = tool_input.get("command", "")
             return cmd[:80] + "..." if len(cmd) > 80 else cmd
-        elif tool_name == "Glob":
-            return tool_input.get("pattern", "")
-        elif tool_name == "Grep":
-            return tool_input.get("pattern", "")
         return str(tool_input)[:80]
     
     def is_complete(self) -> bool:
@@ -293,8 +344,12 @@ class SpecSession:
         return self.complete
     
     def get_messages(self) -> list[dict]:
-        """Get all messages in the conversation."""
-        return self.messages.copy()
+        """Get all messages in the conversation.
+
+        Returns the live message list - callers treat it as read-only,
+        so there's no point in an O(n) defensive copy per call.
+        """
+        return self.messages
     
     def get_stats(self) -> dict:
         """Get session statistics."""
@@ -303,7 +358,7 @@ class SpecSession:
             "input_tokens": self.total_input_tokens,
             "output_tokens": self.total_output_tokens,
             "cost_usd": self.total_cost_usd,
-            "duration_seconds": (datetime.now() - self.created_at).total_seconds(),
+            "duration_seconds": time.monotonic() - self._created_monotonic,
         }
 
 
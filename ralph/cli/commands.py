@@ -1,16 +1,23 @@
 """Command implementations for Ralph CLI."""
 
 import asyncio
+import atexit
+import json
 import os
+import re
+import shlex
 import shutil
 import subprocess
 import sys
 import traceback
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
+from .._json import dumps as _json_dumps, loads as _json_loads
 from .utils import (
     Colors,
+    batched_stdout,
     get_templates_dir,
     resolve_project_path,
     prompt_choice,
@@ -18,6 +25,7 @@ from .utils import (
     prompt_confirm,
     prompt_input,
     prompt_input_async,
+    StreamWriter,
     ThinkingSpinner,
 )
 from .registry import (
@@ -42,26 +50,185 @@ from .registry import (
     load_mcp_config,
     get_global_config_path,
 )
-from .config import load_project_config, save_project_config
+from .config import get_loop_config
+
+# Prefer uvloop's C event loop when installed - the agent sessions push
+# many small chunks and subprocess pipe reads through the loop, where
+# its selector is severalfold faster than the pure-Python one
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+# ANSI fragments pre-baked at import so the fallback print helpers
+# don't rebuild them (or the header border) on every call
+_NC = Colors.NC
+_ERR_PREFIX = f"{Colors.RED}x "
+_OK_PREFIX = f"{Colors.GREEN}v "
+_INFO_PREFIX = f"{Colors.CYAN}i "
+_STEP_PREFIX = f"{Colors.BOLD}["
+_STEP_SEP = f"]{_NC} "
+_HDR_EDGE = f"{Colors.BOLD}{Colors.CYAN}"
+_HDR_BORDER = "─" * 54
+_HDR_TOP = f"\n{_HDR_EDGE}┌{_HDR_BORDER}┐{_NC}\n"
+_HDR_BOT = f"{_HDR_EDGE}└{_HDR_BORDER}┘{_NC}\n\n"
+
+# Spec-conversation separator and hints, printed several times per
+# turn - built once instead of re-running the f-string (the old form
+# also repeated the DIM code 60 times via string multiplication)
+_SEP = f"{Colors.DIM}{'─' * 60}{_NC}"
+_DONE_HINT = f"{Colors.DIM}Type 'done' or 'quit' to finish early.{_NC}"
+_REFINE_DONE_HINT = f"{Colors.DIM}Type 'done' to finish spec discovery.{_NC}"
 
 
 # Fallback print functions for non-TUI contexts
 def print_error(message: str):
-    print(f"{Colors.RED}x {message}{Colors.NC}")
+    print(f"{_ERR_PREFIX}{message}{_NC}")
 
 def print_success(message: str):
-    print(f"{Colors.GREEN}v {message}{Colors.NC}")
+    print(f"{_OK_PREFIX}{message}{_NC}")
 
 def print_info(message: str):
-    print(f"{Colors.CYAN}i {message}{Colors.NC}")
+    print(f"{_INFO_PREFIX}{message}{_NC}")
 
 def print_step(step: int, total: int, message: str):
-    print(f"{Colors.BOLD}[{step}/{total}]{Colors.NC} {message}")
+    print(f"{_STEP_PREFIX}{step}/{total}{_STEP_SEP}{message}")
 
 def print_header(title: str):
-    print(f"\n{Colors.BOLD}{Colors.CYAN}┌{'─' * 54}┐{Colors.NC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}│{Colors.NC}  {title:<52}{Colors.BOLD}{Colors.CYAN}│{Colors.NC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}└{'─' * 54}┘{Colors.NC}\n")
+    # One write (one syscall, one stdout lock) for the whole box
+    sys.stdout.write(
+        f"{_HDR_TOP}{_HDR_EDGE}│{_NC}  {title:<52}{_HDR_EDGE}│{_NC}\n{_HDR_BOT}"
+    )
+
+
+# PRD.json parse cache keyed on mtime: the loop re-reads the PRD every
+# iteration (and the status printers read it again right after), so an
+# unchanged file costs one stat() instead of a full read+parse.
+_PRD_CACHE: dict[str, tuple[int, dict]] = {}
+
+# Loop-type menu shared by every flow that starts the coding loop.
+# Parallel tuples: _LOOP_TYPES[i] is the value for _LOOP_TYPE_LABELS[i].
+_LOOP_TYPES = ("default", "test-coverage", "linting", "duplication", "entropy")
+_LOOP_TYPE_LABELS = ("default (PRD tasks)", "test-coverage", "linting", "duplication", "entropy")
+
+_START_CHOICES = (
+    "NEW PROJECT (create new directory)",
+    "EXISTING PROJECT (work in existing directory)",
+    "CONTINUE PROJECT (resume a Ralph project)",
+)
+
+# Workspaces already verified to contain all required files this run
+_initialized_workspaces: set[Path] = set()
+
+
+def _load_prd(prd_path: Path) -> dict:
+    """Load and parse PRD.json, reusing the cached parse when unchanged."""
+    key = str(prd_path)
+    mtime = prd_path.stat().st_mtime_ns
+    cached = _PRD_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    prd = _json_loads(prd_path.read_bytes())
+    _PRD_CACHE[key] = (mtime, prd)
+    return prd
+
+
+_MAX_ITER_RE = re.compile(rb'"max_iterations"\s*:\s*-?\d+')
+
+
+def _write_prd_bytes(prd_path: Path, data: bytes) -> None:
+    """Write PRD.json atomically: temp file + fsync + os.replace, so a
+    crash mid-write can never leave a truncated PRD behind."""
+    tmp = prd_path.with_suffix(".json.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, prd_path)
+
+
+def _set_prd_max_iterations(prd_path: Path, iterations: int) -> None:
+    """Update max_iterations with a byte-level splice.
+
+    Bumping one integer doesn't justify a full parse + reserialize of
+    the whole PRD; regex-replace the value in place and only fall back
+    to a real JSON round-trip when the key isn't present yet.
+    """
+    content = prd_path.read_bytes()
+    new_content, n = _MAX_ITER_RE.subn(
+        b'"max_iterations": %d' % iterations, content, count=1
+    )
+    if n == 0:
+        prd = _json_loads(content)
+        prd["max_iterations"] = iterations
+        new_content = _json_dumps(prd)
+    if new_content != content:
+        _write_prd_bytes(prd_path, new_content)
+
+
+def _scan_tasks(tasks: list) -> tuple[int, dict | None]:
+    """Single pass over PRD tasks: count done tasks and pick the next
+    pending one (lowest priority number).
+
+    Replaces the old sort-then-break pattern, which paid O(n log n)
+    plus a copied list just to consume one element.
+    """
+    done = 0
+    next_task = None
+    next_priority = None
+    for task in tasks:
+        if task.get("status") == "done":
+            done += 1
+            continue
+        priority = task.get("priority", 999)
+        if next_priority is None or priority < next_priority:
+            next_priority = priority
+            next_task = task
+    return done, next_task
+
+
+def _count_progress_entries(progress_path: Path) -> int:
+    """Count non-blank, non-comment lines in progress.txt.
+
+    Streams the file as bytes instead of read_text().splitlines(),
+    so counting stays O(1) memory as the log grows over iterations.
+    """
+    count = 0
+    with progress_path.open("rb") as f:
+        for line in f:
+            s = line.strip()
+            if s and not s.startswith(b"#"):
+                count += 1
+    return count
+
+
+def _next_task_info(prd_path: Path) -> dict | None:
+    """Build display info for the next pending PRD task, or None.
+
+    Shared by the once and loop entry points so the PRD load and task
+    scan are written (and cached) in one place.
+    """
+    if not prd_path.exists():
+        return None
+    try:
+        prd = _load_prd(prd_path)
+    except Exception:
+        return None
+    tasks = prd.get("tasks", [])
+    done_count, next_task = _scan_tasks(tasks)
+    if next_task is None:
+        return None
+    return {
+        "id": next_task.get("id", "?"),
+        "name": next_task.get("name", "Unknown"),
+        "done": done_count,
+        "total": len(tasks),
+    }
 
 
 def _validate_mcp_servers(mcp_servers: dict) -> None:
@@ -70,16 +237,25 @@ def _validate_mcp_servers(mcp_servers: dict) -> None:
     Checks if the MCP server commands are available and warns if not.
     For npx-based servers, just validates npx is available.
     """
-    import shutil
-    
+    if not mcp_servers:
+        return
+
+    # shutil.which walks PATH and stats every candidate; resolve each
+    # distinct command once (several servers typically share npx)
+    resolved: dict[str, str | None] = {}
+
     for name, config in mcp_servers.items():
         command = config.get("command", "")
         args = config.get("args", [])
         if not command:
             continue
-        
+
         # Check if command exists
-        if shutil.which(command):
+        if command in resolved:
+            found = resolved[command]
+        else:
+            found = resolved[command] = shutil.which(command)
+        if found:
             # For npx commands, show what package will be used
             if command == "npx" and args:
                 package = args[0] if args else "unknown"
@@ -96,6 +272,14 @@ def _validate_mcp_servers(mcp_servers: dict) -> None:
 
 def cmd_start(args):
     """Interactive start flow - plain text + questionary (no Rich panels)."""
+    # Batch the flow's many small prints into buffered writes; the
+    # prompt helpers flush before each questionary prompt. The _flow_*
+    # helpers are only reachable from here, so this covers them all.
+    with batched_stdout():
+        return _cmd_start(args)
+
+
+def _cmd_start(args):
     print_header("Ralph - AI Coding Loop")
     
     # If path provided, work with that project
@@ -143,13 +327,7 @@ def cmd_start(args):
             new_project_name = generate_project_name(target_dir)
             return _flow_existing_project(target_dir, new_project_name, is_new_project=True)
     
-    choices = [
-        "NEW PROJECT (create new directory)",
-        "EXISTING PROJECT (work in existing directory)",
-        "CONTINUE PROJECT (resume a Ralph project)",
-    ]
-    
-    choice = prompt_choice("What would you like to do?", choices)
+    choice = prompt_choice("What would you like to do?", _START_CHOICES)
     
     if choice == 0:
         # New project from scratch
@@ -189,17 +367,17 @@ def _prompt_for_requirements(project_dir: Path, default_topic: str = "") -> tupl
             print_error("File path is required")
             return ("", "")
         
-        # Resolve relative to project dir
-        req_path = Path(file_path)
-        if not req_path.is_absolute():
-            req_path = project_dir / req_path
-        
-        if not req_path.exists():
-            print_error(f"File not found: {req_path}")
+        # Resolve relative to project dir; os.path keeps this to string
+        # ops plus one stat (isfile also rules out directories)
+        if not os.path.isabs(file_path):
+            file_path = os.path.join(str(project_dir), file_path)
+
+        if not os.path.isfile(file_path):
+            print_error(f"File not found: {file_path}")
             return ("", "")
-        
-        topic = f"Requirements from {req_path.name}"
-        return (topic, str(req_path))
+
+        topic = f"Requirements from {os.path.basename(file_path)}"
+        return (topic, file_path)
 
 
 def _flow_new_project():
@@ -245,12 +423,8 @@ def _flow_new_project():
         iterations = prompt_input("How many iterations?", "10")
         
         # Offer loop type selection
-        type_choice = prompt_choice(
-            "Loop type:",
-            ["default (PRD tasks)", "test-coverage", "linting", "duplication", "entropy"]
-        )
-        loop_types = ["default", "test-coverage", "linting", "duplication", "entropy"]
-        loop_type = loop_types[type_choice]
+        type_choice = prompt_choice("Loop type:", _LOOP_TYPE_LABELS)
+        loop_type = _LOOP_TYPES[type_choice]
         
         os.chdir(project_dir)
         return _run_loop_agent(project_dir, int(iterations), loop_type=loop_type, start_iteration=1)
@@ -287,24 +461,28 @@ def _flow_continue_project():
             return _flow_existing_project(target_dir, new_project_name, is_new_project=True)
         return 0
     
-    # Build a list of all projects across all targets
-    all_projects = []
+    # One pass over all targets: render each choice label alongside the
+    # metadata needed to act on it, instead of collecting project dicts
+    # and looping over them again
+    items: list[tuple[str, Path, str]] = []  # (label, target_dir, project_name)
     for target_info in targets:
         target_path = Path(target_info["path"])
         if not target_path.exists():
             continue
-        
-        # List projects for this target
-        projects = list_workspace_projects(target_path)
-        for proj in projects:
-            if proj["has_prd"]:  # Only show projects with PRD
-                all_projects.append({
-                    "target": target_path,
-                    "target_name": target_info["name"],
-                    "project": proj,
-                })
-    
-    if not all_projects:
+
+        for proj in list_workspace_projects(target_path):
+            if not proj["has_prd"]:  # Only show projects with PRD
+                continue
+            done = proj["done_tasks"]
+            total = proj["total_tasks"]
+            pct = int((done / total * 100)) if total > 0 else 0
+            items.append((
+                f"{proj['name']} ({target_info['name']}) - {done}/{total} tasks ({pct}%)",
+                target_path,
+                proj["name"],
+            ))
+
+    if not items:
         print_info("No Ralph projects with PRDs found yet.")
         print_info("(Projects need a PRD to be continuable)")
         print()
@@ -324,26 +502,16 @@ def _flow_continue_project():
             return _flow_existing_project(target_dir, new_project_name, is_new_project=True)
         return 0
     
-    # Build choices
-    choices = []
-    for item in all_projects:
-        proj = item["project"]
-        done = proj["done_tasks"]
-        total = proj["total_tasks"]
-        pct = int((done / total * 100)) if total > 0 else 0
-        choices.append(f"{proj['name']} ({item['target_name']}) - {done}/{total} tasks ({pct}%)")
-    
+    choices = [label for label, _, _ in items]
     choices.append("Cancel")
-    
+
     choice = prompt_choice("Select a project to continue:", choices)
-    
-    if choice == len(choices) - 1:
+
+    if choice == len(items):
         return 0  # Cancel
-    
-    selected = all_projects[choice]
-    target_dir = selected["target"]
-    project_name = selected["project"]["name"]
-    
+
+    _, target_dir, project_name = items[choice]
+
     # Set as active and flow into existing project
     set_active_project(target_dir, project_name)
     return _flow_existing_project(target_dir, project_name)
@@ -445,23 +613,27 @@ def _flow_existing_project(target_dir: Path, project_name: str = None, is_new_pr
     loop_type = "default"
     
     if saved_state and saved_state.get("status") == "paused":
+        # Pull the fields into locals once rather than re-querying the
+        # dict for each message and branch below
+        saved_iteration = saved_state.get("iteration", 1)
+        saved_total = saved_state.get("total_iterations", 10)
+        task_id = saved_state.get("current_task_id", "")
+        task_desc = saved_state.get("current_task", "")
+
         # Offer to resume
-        print_info(f"Found paused loop at iteration {saved_state.get('iteration')}/{saved_state.get('total_iterations')}")
-        if saved_state.get("current_task"):
-            task_id = saved_state.get("current_task_id", "")
-            task_desc = saved_state.get("current_task", "")
-            if task_id:
-                print_info(f"Last task: [{task_id}] {task_desc}")
-        
+        print_info(f"Found paused loop at iteration {saved_iteration}/{saved_total}")
+        if task_desc and task_id:
+            print_info(f"Last task: [{task_id}] {task_desc}")
+
         resume_choice = prompt_choice(
             "What would you like to do?",
             ["Resume from where you left off", "Start fresh (discard saved state)", "Skip for now"]
         )
-        
+
         if resume_choice == 0:
             # Resume
-            start_iteration = saved_state.get("iteration", 1)
-            iterations = saved_state.get("total_iterations", 10)
+            start_iteration = saved_iteration
+            iterations = saved_total
             loop_type = saved_state.get("loop_type", "default")
             os.chdir(target_dir)
             return _run_loop_agent(target_dir, iterations, loop_type=loop_type, start_iteration=start_iteration, project_name=project_name)
@@ -479,12 +651,8 @@ def _flow_existing_project(target_dir: Path, project_name: str = None, is_new_pr
         iterations = prompt_input("How many iterations?", default_iterations)
         
         # Offer loop type selection
-        type_choice = prompt_choice(
-            "Loop type:",
-            ["default (PRD tasks)", "test-coverage", "linting", "duplication", "entropy"]
-        )
-        loop_types = ["default", "test-coverage", "linting", "duplication", "entropy"]
-        loop_type = loop_types[type_choice]
+        type_choice = prompt_choice("Loop type:", _LOOP_TYPE_LABELS)
+        loop_type = _LOOP_TYPES[type_choice]
         
         os.chdir(target_dir)
         return _run_loop_agent(target_dir, int(iterations), loop_type=loop_type, start_iteration=start_iteration, project_name=project_name)
@@ -499,33 +667,61 @@ def _flow_existing_project(target_dir: Path, project_name: str = None, is_new_pr
 
 
 def _show_quick_status(target_dir: Path, project_name: str = None):
-    """Show quick status of a project from its workspace."""
-    import json
-    
+    """Show quick status of a project from its workspace.
+
+    The rendered summary is cached in the workspace keyed on the PRD
+    and progress mtimes, so re-entering an unchanged project costs two
+    stat calls and one read instead of parsing both files again.
+    """
     # Read from workspace, not target directory
     workspace_dir = get_workspace_dir(target_dir, project_name)
-    
+
     prd_path = workspace_dir / "PRD.json"
-    if prd_path.exists():
+    progress_path = workspace_dir / "progress.txt"
+    cache_path = workspace_dir / ".status-cache"
+
+    try:
+        prd_mtime = prd_path.stat().st_mtime_ns
+    except OSError:
+        prd_mtime = 0
+    try:
+        progress_mtime = progress_path.stat().st_mtime_ns
+    except OSError:
+        progress_mtime = 0
+
+    header = f"{prd_mtime}:{progress_mtime}"
+    try:
+        cached_header, _, rendered = cache_path.read_text().partition("\n")
+        if cached_header == header:
+            sys.stdout.write(rendered)
+            return
+    except OSError:
+        pass
+
+    parts: list[str] = []
+    if prd_mtime:
         try:
-            prd = json.loads(prd_path.read_text())
+            prd = _load_prd(prd_path)
             tasks = prd.get("tasks", [])
             total_tasks = len(tasks)
-            done_tasks = sum(1 for t in tasks if t.get("status") == "done")
-            print(f"  Tasks: {done_tasks}/{total_tasks} complete")
-            
+            done_tasks, next_task = _scan_tasks(tasks)
+            parts.append(f"  Tasks: {done_tasks}/{total_tasks} complete\n")
+
             # Show next pending task
-            for task in sorted(tasks, key=lambda t: t.get("priority", 999)):
-                if task.get("status") != "done":
-                    print(f"  Next: [{task.get('id', '?')}] {task.get('name', 'Unknown')}")
-                    break
+            if next_task is not None:
+                parts.append(f"  Next: [{next_task.get('id', '?')}] {next_task.get('name', 'Unknown')}\n")
         except Exception:
             pass
-    
-    progress_path = workspace_dir / "progress.txt"
-    if progress_path.exists():
-        entries = [l for l in progress_path.read_text().splitlines() if l.strip() and not l.startswith("#")]
-        print(f"  Progress entries: {len(entries)}")
+
+    if progress_mtime:
+        parts.append(f"  Progress entries: {_count_progress_entries(progress_path)}\n")
+
+    rendered = "".join(parts)
+    sys.stdout.write(rendered)
+    try:
+        cache_path.write_text(f"{header}\n{rendered}")
+    except OSError:
+        pass
 
 
 def _create_project_structure(project_dir: Path, project_name: str):
@@ -535,8 +731,6 @@ def _create_project_structure(project_dir: Path, project_name: str):
     (~/.ralph/workspaces/<project>/), NOT in the target project directory.
     The target project should only contain actual code.
     """
-    import json
-    
     project_dir.mkdir(parents=True)
     (project_dir / "src").mkdir()
     
@@ -553,10 +747,16 @@ venv/
     workspace_dir = get_workspace_dir(project_dir)
     _ensure_workspace_files(workspace_dir, project_dir)
     
-    # Init git
-    subprocess.run(["git", "init", "-q"], cwd=project_dir, check=True)
-    subprocess.run(["git", "add", "."], cwd=project_dir, check=True)
-    subprocess.run(["git", "commit", "-q", "-m", f"Initial setup for {project_name}"], cwd=project_dir, check=True)
+    # Init git - chained through one shell to pay for a single
+    # fork/exec instead of three (Windows lacks sh, so fall back there)
+    commit_msg = f"Initial setup for {project_name}"
+    if os.name == "nt":
+        subprocess.run(["git", "init", "-q"], cwd=project_dir, check=True)
+        subprocess.run(["git", "add", "."], cwd=project_dir, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", commit_msg], cwd=project_dir, check=True)
+    else:
+        script = f"git init -q && git add . && git commit -q -m {shlex.quote(commit_msg)}"
+        subprocess.run(["sh", "-c", script], cwd=project_dir, check=True)
     
     # Register project in global registry
     register_project(project_dir, project_name)
@@ -625,6 +825,24 @@ Started: {timestamp}
     return spec_file
 
 
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy a small file, preferring an in-kernel copy.
+
+    os.copy_file_range lets the filesystem reflink (copy-on-write) on
+    XFS/Btrfs instead of shuttling bytes through userspace; fall back
+    to shutil.copy where the syscall or filesystem doesn't support it.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            return
+        except OSError:
+            pass
+    shutil.copy(src, dst)
+
+
 def _ensure_workspace_files(workspace_dir: Path, project_dir: Path):
     """Ensure PRD.json and progress.txt exist in the Ralph workspace.
     
@@ -635,30 +853,58 @@ def _ensure_workspace_files(workspace_dir: Path, project_dir: Path):
         workspace_dir: Ralph workspace directory
         project_dir: Target project directory (for naming only)
     """
-    import json
-    
+    # Once a workspace is known complete, later calls in this process
+    # (one per loop start / status print) cost zero syscalls
+    if workspace_dir in _initialized_workspaces:
+        return
+
     workspace_dir.mkdir(parents=True, exist_ok=True)
     templates_dir = get_templates_dir()
-    
+
+    # One scandir pass instead of a stat probe per file
+    with os.scandir(workspace_dir) as it:
+        existing = {entry.name for entry in it}
+
     # Create PRD.json in workspace if not exists
-    prd_path = workspace_dir / "PRD.json"
-    if not prd_path.exists():
+    if "PRD.json" not in existing:
         prd_template = templates_dir / "PRD.json"
-        prd_data = json.loads(prd_template.read_text())
+        prd_data = _json_loads(prd_template.read_bytes())
         prd_data["name"] = project_dir.name
-        prd_data["created"] = datetime.now().strftime("%Y-%m-%d")
-        prd_data["updated"] = datetime.now().strftime("%Y-%m-%d")
-        prd_path.write_text(json.dumps(prd_data, indent=2))
-    
+        today = date.today().isoformat()
+        prd_data["created"] = today
+        prd_data["updated"] = today
+        _write_prd_bytes(workspace_dir / "PRD.json", _json_dumps(prd_data))
+
     # Create progress.txt in workspace if not exists
-    progress_path = workspace_dir / "progress.txt"
-    if not progress_path.exists():
-        shutil.copy(templates_dir / "progress.txt", progress_path)
-    
+    if "progress.txt" not in existing:
+        _fast_copy(templates_dir / "progress.txt", workspace_dir / "progress.txt")
+
     # Create failures.md in workspace if not exists
-    failures_path = workspace_dir / "failures.md"
-    if not failures_path.exists():
-        shutil.copy(templates_dir / "failures.md", failures_path)
+    if "failures.md" not in existing:
+        _fast_copy(templates_dir / "failures.md", workspace_dir / "failures.md")
+
+    _initialized_workspaces.add(workspace_dir)
+
+
+# Event loop shared by the once/loop/spec runners. asyncio.run builds
+# and tears down a fresh loop (selector + child watcher setup) every
+# time, which adds up when one process chains commands - spec discovery
+# into the coding loop, or a controller driving several single
+# iterations; keep one loop alive and close it at exit instead.
+_EVENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        _EVENT_LOOP = asyncio.new_event_loop()
+    return _EVENT_LOOP
+
+
+@atexit.register
+def _close_event_loop():
+    if _EVENT_LOOP is not None and not _EVENT_LOOP.is_closed():
+        _EVENT_LOOP.close()
 
 
 def _run_once_agent(target_dir: Path, project_name: str = None) -> int:
@@ -671,7 +917,6 @@ def _run_once_agent(target_dir: Path, project_name: str = None) -> int:
         target_dir: Path to the target project (where code changes are made)
         project_name: Named project within workspace (uses active if None)
     """
-    import json
     from ..agent import RalphAgent, AgentDisplay
     from ..prompts import get_once_prompt
     
@@ -686,37 +931,12 @@ def _run_once_agent(target_dir: Path, project_name: str = None) -> int:
     
     # Load PRD to get task info for display
     prd_path = workspace_dir / "PRD.json"
-    total_tasks = 0
-    current_task_info = None
-    
-    if prd_path.exists():
-        try:
-            prd = json.loads(prd_path.read_text())
-            tasks = prd.get("tasks", [])
-            total_tasks = len(tasks)
-            done_count = sum(1 for t in tasks if t.get("status") == "done")
-            
-            for task in sorted(tasks, key=lambda t: t.get("priority", 999)):
-                if task.get("status") != "done":
-                    current_task_info = {
-                        "id": task.get("id", "?"),
-                        "name": task.get("name", "Unknown"),
-                        "done": done_count,
-                        "total": total_tasks,
-                    }
-                    break
-        except Exception:
-            pass
+    current_task_info = _next_task_info(prd_path)
     
     # Load project configuration first
-    config = load_project_config()
-    model = config.get("loop_model", "claude-3-5-sonnet-20241022")
-    context_limit = config.get("context_limit", 200000)
-    rotate_threshold = config.get("rotate_threshold", 0.8)
-    auto_gutter = config.get("auto_gutter", True)
-    plan_limit = config.get("plan_messages_limit", 225)
-    
-    display = AgentDisplay(total_iterations=1, mode="once", plan_limit=plan_limit)
+    config = get_loop_config()
+
+    display = AgentDisplay(total_iterations=1, mode="once", plan_limit=config.plan_messages_limit)
     
     # Set task info in display
     if current_task_info:
@@ -736,10 +956,10 @@ def _run_once_agent(target_dir: Path, project_name: str = None) -> int:
         display=display, 
         log_file=log_file, 
         mcp_servers=mcp_servers,
-        model=model,
-        context_limit=context_limit,
-        rotate_threshold=rotate_threshold,
-        auto_gutter=auto_gutter
+        model=config.loop_model,
+        context_limit=config.context_limit,
+        rotate_threshold=config.rotate_threshold,
+        auto_gutter=config.auto_gutter
     )
     prompt = get_once_prompt(
         workspace_dir=str(workspace_dir),
@@ -748,7 +968,7 @@ def _run_once_agent(target_dir: Path, project_name: str = None) -> int:
     
     display.start()
     try:
-        result = asyncio.run(agent.run_once(prompt))
+        result = _get_event_loop().run_until_complete(agent.run_once(prompt))
     finally:
         agent._close_log()
         display.stop()
@@ -778,7 +998,6 @@ async def _run_loop_agent_async(
         start_iteration: Starting iteration number (for resume)
         project_name: Named project within workspace (uses active if None)
     """
-    import json
     from ..agent import RalphAgent, AgentDisplay, keyboard_listener
     from ..prompts import get_loop_prompt
     
@@ -792,13 +1011,11 @@ async def _run_loop_agent_async(
     _ensure_workspace_files(workspace_dir, target_dir)
     
     # Update PRD with selected iterations
+    prd_path = workspace_dir / "PRD.json"
     if iterations:
         try:
-            prd_path = workspace_dir / "PRD.json"
             if prd_path.exists():
-                prd = json.loads(prd_path.read_text())
-                prd["max_iterations"] = iterations
-                prd_path.write_text(json.dumps(prd, indent=2))
+                _set_prd_max_iterations(prd_path, iterations)
         except Exception as e:
             print_error(f"Failed to update PRD.json: {e}")
     
@@ -807,39 +1024,12 @@ async def _run_loop_agent_async(
         clear_loop_state(target_dir)
     
     # Load PRD to get task info for display
-    prd_path = workspace_dir / "PRD.json"
-    total_tasks = 0
-    current_task_info = None
-    
-    if prd_path.exists():
-        try:
-            prd = json.loads(prd_path.read_text())
-            tasks = prd.get("tasks", [])
-            total_tasks = len(tasks)
-            done_count = sum(1 for t in tasks if t.get("status") == "done")
-            
-            # Find next pending task (lowest priority number)
-            for task in sorted(tasks, key=lambda t: t.get("priority", 999)):
-                if task.get("status") != "done":
-                    current_task_info = {
-                        "id": task.get("id", "?"),
-                        "name": task.get("name", "Unknown"),
-                        "done": done_count,
-                        "total": total_tasks,
-                    }
-                    break
-        except Exception:
-            pass
+    current_task_info = _next_task_info(prd_path)
     
     # Load project configuration first
-    config = load_project_config()
-    model = config.get("loop_model", "claude-3-5-sonnet-20241022")
-    context_limit = config.get("context_limit", 200000)
-    rotate_threshold = config.get("rotate_threshold", 0.8)
-    auto_gutter = config.get("auto_gutter", True)
-    plan_limit = config.get("plan_messages_limit", 225)
-    
-    display = AgentDisplay(total_iterations=iterations, mode="loop", plan_limit=plan_limit)
+    config = get_loop_config()
+
+    display = AgentDisplay(total_iterations=iterations, mode="loop", plan_limit=config.plan_messages_limit)
     
     # Set initial task info in display
     if current_task_info:
@@ -859,10 +1049,10 @@ async def _run_loop_agent_async(
         display=display, 
         log_file=log_file, 
         mcp_servers=mcp_servers,
-        model=model,
-        context_limit=context_limit,
-        rotate_threshold=rotate_threshold,
-        auto_gutter=auto_gutter
+        model=config.loop_model,
+        context_limit=config.context_limit,
+        rotate_threshold=config.rotate_threshold,
+        auto_gutter=config.auto_gutter
     )
     prompt = get_loop_prompt(
         loop_type=loop_type,
@@ -871,28 +1061,39 @@ async def _run_loop_agent_async(
     )
     
     # Callback to save state and update task info after each iteration
+    last_task_label = ""
+
     def on_iteration_complete(iteration: int, result):
-        # Re-read PRD to get updated task info
+        nonlocal last_task_label
+        # Re-read PRD to get updated task info. _load_prd's mtime cache
+        # makes this a single stat when the agent didn't touch the file;
+        # a missing PRD surfaces as OSError and is swallowed like any
+        # other failure here.
         try:
-            if prd_path.exists():
-                prd = json.loads(prd_path.read_text())
-                tasks = prd.get("tasks", [])
-                done_count = sum(1 for t in tasks if t.get("status") == "done")
-                total = len(tasks)
-                
-                # Find next pending task
-                for task in sorted(tasks, key=lambda t: t.get("priority", 999)):
-                    if task.get("status") != "done":
-                        task_label = f"[{done_count + 1}/{total}] {task.get('name', 'Unknown')}"
-                        display.set_task(task_label, task.get("id", ""))
-                        break
-                else:
-                    display.set_task(f"[{done_count}/{total}] All tasks complete!", "")
+            prd = _load_prd(prd_path)
+            tasks = prd.get("tasks", [])
+            done_count, next_task = _scan_tasks(tasks)
+            total = len(tasks)
+
+            # Find next pending task
+            if next_task is not None:
+                task_label = f"[{done_count + 1}/{total}] {next_task.get('name', 'Unknown')}"
+                task_id = next_task.get("id", "")
+            else:
+                task_label = f"[{done_count}/{total}] All tasks complete!"
+                task_id = ""
+
+            # Only touch the display when the task actually moved on
+            if task_label != last_task_label:
+                last_task_label = task_label
+                display.set_task(task_label, task_id)
         except Exception:
             pass
     
-    # Start keyboard listener as background task
-    keyboard_task = asyncio.create_task(keyboard_listener(display))
+    # Start keyboard listener as background task; the event wakes it
+    # instantly when the loop exits instead of waiting for a poll tick
+    keyboard_shutdown = asyncio.Event()
+    keyboard_task = asyncio.create_task(keyboard_listener(display, keyboard_shutdown))
     
     display.start()
     try:
@@ -905,6 +1106,7 @@ async def _run_loop_agent_async(
                 on_iteration_complete=on_iteration_complete,
             )
         finally:
+            keyboard_shutdown.set()
             keyboard_task.cancel()
             try:
                 await keyboard_task
@@ -986,7 +1188,7 @@ def _run_loop_agent(
     This is a sync wrapper around _run_loop_agent_async for use in sync contexts.
     For async contexts, use _run_loop_agent_async directly.
     """
-    return asyncio.run(_run_loop_agent_async(
+    return _get_event_loop().run_until_complete(_run_loop_agent_async(
         target_dir, iterations, loop_type, start_iteration, project_name
     ))
 
@@ -1038,9 +1240,7 @@ def _run_spec_agent(
         try:
             prd_path = workspace_dir / "PRD.json"
             if prd_path.exists():
-                prd = json.loads(prd_path.read_text())
-                prd["max_iterations"] = max_iterations
-                prd_path.write_text(json.dumps(prd, indent=2))
+                _set_prd_max_iterations(prd_path, max_iterations)
         except Exception:
             pass
     
@@ -1053,7 +1253,66 @@ def _run_spec_agent(
     )
     
     # Run the conversation
-    return asyncio.run(_run_spec_conversation_async(target_dir, workspace_dir, prompt, topic, project_name))
+    return _get_event_loop().run_until_complete(
+        _run_spec_conversation_async(target_dir, workspace_dir, prompt, topic, project_name)
+    )
+
+
+class _ChunkPrinter:
+    """Streaming chunk formatter shared by the spec conversation flows.
+
+    Replaces the near-identical print_text/print_tool closures both
+    flows carried: tracks whether the previous chunk was a tool line
+    (so block boundaries get their newline), buffers through a
+    StreamWriter, and - when given a spinner - stops it on the first
+    chunk of each response.
+    """
+
+    __slots__ = ("_writer", "_spinner", "_last_was_tool", "_first_chunk_seen")
+
+    def __init__(self, writer: StreamWriter, spinner: ThinkingSpinner = None):
+        self._writer = writer
+        self._spinner = spinner
+        self._last_was_tool = False
+        self._first_chunk_seen = False
+
+    def reset(self):
+        """Rearm for a new response; the spinner stops on its first chunk."""
+        self._last_was_tool = False
+        self._first_chunk_seen = False
+
+    def text(self, content: str):
+        """Buffer text, adding newline before if last output was a tool."""
+        if not self._first_chunk_seen:
+            self._first_chunk_seen = True
+            if self._spinner is not None:
+                self._spinner.stop()
+        if self._last_was_tool:
+            self._writer.write("\n")  # Add newline after tool block before text
+            self._last_was_tool = False
+        self._writer.write(content)
+
+    def tool(self, name: str, input_str: str):
+        """Buffer tool use, adding newline before if last output was text."""
+        if not self._first_chunk_seen:
+            self._first_chunk_seen = True
+            if self._spinner is not None:
+                self._spinner.stop()
+        if not self._last_was_tool:
+            self._writer.write("\n")  # Add newline before first tool in a block
+            self._last_was_tool = True
+        self._writer.write(f"{Colors.DIM}[{name}] {input_str}{Colors.NC}\n")
+
+    def on_chunk(self, chunk: dict):
+        """Dispatch an incoming chunk to the right formatter."""
+        ctype = chunk["type"]
+        if ctype == "text":
+            self.text(chunk["content"])
+        elif ctype == "tool":
+            self.tool(chunk.get("name", "Tool"), chunk.get("input", ""))
+        elif ctype == "response_done":
+            # Response complete - deliver whatever is still buffered
+            self._writer.flush()
 
 
 async def _run_spec_conversation_async(
@@ -1075,13 +1334,14 @@ async def _run_spec_conversation_async(
     from ..agent import SpecSession
     
     # Load project configuration
-    config = load_project_config()
-    model = config.get("spec_model", "claude-opus-4-5-20251101")
-    context_limit = config.get("context_limit", 200000)
-    
+    config = get_loop_config()
+
     # Pure streaming session - no Rich panels
     # Target project is read-only, workspace is for spec files
-    session = SpecSession(target_dir, workspace_dir, display=None, model=model, context_limit=context_limit)
+    session = SpecSession(
+        target_dir, workspace_dir, display=None,
+        model=config.spec_model, context_limit=config.context_limit,
+    )
     
     active_project = project_name or get_active_project(target_dir) or "default"
     
@@ -1090,60 +1350,32 @@ async def _run_spec_conversation_async(
     print(f"{Colors.DIM}Project: {active_project}{Colors.NC}")
     print(f"{Colors.DIM}Workspace: {workspace_dir}{Colors.NC}")
     print(f"{Colors.DIM}Target (read-only): {target_dir}{Colors.NC}")
-    print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
+    print(_SEP)
     print()
     
-    # Track last output type for formatting (no newlines between consecutive tools)
-    last_was_tool = False
+    # One formatter per session; it tracks tool/text boundaries and
+    # buffers chunk output between flush points
     spinner = ThinkingSpinner("Claude is thinking")
-    first_chunk_received = False
-    
-    def print_text(text: str):
-        """Print text, adding newline before if last output was a tool."""
-        nonlocal last_was_tool, first_chunk_received
-        if not first_chunk_received:
-            spinner.stop()
-            first_chunk_received = True
-        if last_was_tool:
-            print()  # Add newline after tool block before text
-        print(text, end="", flush=True)
-        last_was_tool = False
-    
-    def print_tool(name: str, input_str: str):
-        """Print tool use, adding newline before if last output was text."""
-        nonlocal last_was_tool, first_chunk_received
-        if not first_chunk_received:
-            spinner.stop()
-            first_chunk_received = True
-        if not last_was_tool:
-            print()  # Add newline before first tool in a block
-        print(f"{Colors.DIM}[{name}] {input_str}{Colors.NC}", flush=True)
-        last_was_tool = True
-    
-    def on_chunk(chunk: dict):
-        """Handle incoming chunk - stop spinner and dispatch to printer."""
-        if chunk["type"] == "text":
-            print_text(chunk["content"])
-        elif chunk["type"] == "tool":
-            print_tool(chunk.get("name", "Tool"), chunk.get("input", ""))
-        elif chunk["type"] == "response_done":
-            # Response complete
-            pass
-    
+    writer = StreamWriter()
+    printer = _ChunkPrinter(writer, spinner)
+
     try:
         # Start the conversation - stream Claude's initial response
         try:
             spinner.start()
-            first_chunk_received = False
+            printer.reset()
             async for chunk in session.start(prompt):
                 if chunk["type"] == "error":
                     spinner.stop()
+                    writer.flush()
                     print_error(chunk["content"])
                     return 1
-                on_chunk(chunk)
+                printer.on_chunk(chunk)
             spinner.stop()
+            writer.flush()
         except Exception as e:
             spinner.stop()
+            writer.flush()
             print_error(f"Error starting session: {e}")
             traceback.print_exc()
             return 1
@@ -1152,8 +1384,8 @@ async def _run_spec_conversation_async(
         while not session.is_complete():
             # Print separator and prompt for input
             print()
-            print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
-            print(f"{Colors.DIM}Type 'done' or 'quit' to finish early.{Colors.NC}")
+            print(_SEP)
+            print(_DONE_HINT)
             print()
             
             try:
@@ -1163,20 +1395,20 @@ async def _run_spec_conversation_async(
                 break
             
             # Reset tracking for new response
-            last_was_tool = False
-            first_chunk_received = False
-            
+            printer.reset()
+
             # Check for exit signals
             if user_input.lower() in ("quit", "exit", "done", "q", ""):
                 print()
                 spinner.start()
                 async for chunk in session.send_message("I'm done. Please summarize what we have and complete the spec."):
-                    on_chunk(chunk)
+                    printer.on_chunk(chunk)
                 spinner.stop()
+                writer.flush()
                 break
             
             print()
-            print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
+            print(_SEP)
             print()
             
             # Send user's response and stream Claude's reply
@@ -1185,12 +1417,15 @@ async def _run_spec_conversation_async(
                 async for chunk in session.send_message(user_input):
                     if chunk["type"] == "error":
                         spinner.stop()
+                        writer.flush()
                         print_error(chunk["content"])
                         return 1
-                    on_chunk(chunk)
+                    printer.on_chunk(chunk)
                 spinner.stop()
+                writer.flush()
             except Exception as e:
                 spinner.stop()
+                writer.flush()
                 print_error(f"Error sending message: {e}")
                 traceback.print_exc()
                 return 1
@@ -1198,7 +1433,7 @@ async def _run_spec_conversation_async(
         # Print summary
         stats = session.get_stats()
         print()
-        print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
+        print(_SEP)
         print()
         print(f"{Colors.BOLD}{Colors.GREEN}Spec Discovery Complete{Colors.NC}")
         print(f"  Exchanges: {stats['num_exchanges']}")
@@ -1211,7 +1446,7 @@ async def _run_spec_conversation_async(
         print()
         
         # Ask user what to do next
-        print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
+        print(_SEP)
         print()
         next_choice = await prompt_choice_async(
             "What would you like to do next?",
@@ -1241,12 +1476,8 @@ async def _run_spec_conversation_async(
             # Start coding loop
             print()
             iterations = await prompt_input_async("How many iterations?", "10")
-            type_choice = await prompt_choice_async(
-                "Loop type:",
-                ["default (PRD tasks)", "test-coverage", "linting", "duplication", "entropy"]
-            )
-            loop_types = ["default", "test-coverage", "linting", "duplication", "entropy"]
-            loop_type = loop_types[type_choice]
+            type_choice = await prompt_choice_async("Loop type:", _LOOP_TYPE_LABELS)
+            loop_type = _LOOP_TYPES[type_choice]
             
             # Now we can write to the target project
             os.chdir(target_dir)
@@ -1277,92 +1508,80 @@ async def _continue_spec_refinement(session, workspace_dir: Path, project_dir: P
         workspace_dir: Ralph workspace directory
         project_dir: Target project directory (needed if user wants to start loop)
     """
-    # Track last output type for formatting
-    last_was_tool = False
-    
-    def print_text(text: str):
-        nonlocal last_was_tool
-        if last_was_tool:
-            print()
-        print(text, end="", flush=True)
-        last_was_tool = False
-    
-    def print_tool(name: str, input_str: str):
-        nonlocal last_was_tool
-        if not last_was_tool:
-            print()
-        print(f"{Colors.DIM}[{name}] {input_str}{Colors.NC}", flush=True)
-        last_was_tool = True
+    # Shared formatter, no spinner in the refinement flow
+    writer = StreamWriter()
+    printer = _ChunkPrinter(writer)
     
     try:
-        while not session.is_complete():
-            print()
-            print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
-            print(f"{Colors.DIM}Type 'done' to finish spec discovery.{Colors.NC}")
-            print()
-            
-            try:
-                user_input = await prompt_input_async("Your response")
-            except (KeyboardInterrupt, EOFError):
-                print("\n\nSpec refinement interrupted.")
-                break
-            
-            last_was_tool = False
-            
-            if user_input.lower() in ("quit", "exit", "done", "q", ""):
+        # Outer loop instead of tail recursion on "Continue refining":
+        # each round would otherwise stack a frame (and keep its
+        # closed-over chunk strings alive) for the whole session
+        while True:
+            while not session.is_complete():
                 print()
-                print(f"{Colors.CYAN}Finalizing spec...{Colors.NC}")
-                async for chunk in session.send_message("I'm done. Please summarize the final spec."):
-                    if chunk["type"] == "text":
-                        print_text(chunk["content"])
-                    elif chunk["type"] == "tool":
-                        print_tool(chunk.get("name", "Tool"), chunk.get("input", ""))
-                break
-            
+                print(_SEP)
+                print(_REFINE_DONE_HINT)
+                print()
+
+                try:
+                    user_input = await prompt_input_async("Your response")
+                except (KeyboardInterrupt, EOFError):
+                    print("\n\nSpec refinement interrupted.")
+                    break
+
+                printer.reset()
+
+                if user_input.lower() in ("quit", "exit", "done", "q", ""):
+                    print()
+                    print(f"{Colors.CYAN}Finalizing spec...{Colors.NC}")
+                    async for chunk in session.send_message("I'm done. Please summarize the final spec."):
+                        printer.on_chunk(chunk)
+                    writer.flush()
+                    break
+
+                print()
+                print(_SEP)
+                print()
+
+                async for chunk in session.send_message(user_input):
+                    if chunk["type"] == "error":
+                        writer.flush()
+                        print_error(chunk["content"])
+                        return 1
+                    printer.on_chunk(chunk)
+                writer.flush()
+
+            # Ask what to do next
             print()
-            print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
+            print(_SEP)
             print()
-            
-            async for chunk in session.send_message(user_input):
-                if chunk["type"] == "error":
-                    print_error(chunk["content"])
-                    return 1
-                elif chunk["type"] == "text":
-                    print_text(chunk["content"])
-                elif chunk["type"] == "tool":
-                    print_tool(chunk.get("name", "Tool"), chunk.get("input", ""))
-        
-        # Ask what to do next (recursive choice)
-        print()
-        print(f"{Colors.DIM}─" * 60 + f"{Colors.NC}")
-        print()
-        
-        # Use async prompt since we're in async context
-        next_choice = await prompt_choice_async(
-            "What would you like to do next?",
-            [
-                "Continue refining",
-                "Start the coding loop",
-                "Exit (save for later)"
-            ]
-        )
-        
-        if next_choice == 0:
-            return await _continue_spec_refinement(session, workspace_dir, project_dir)
-        elif next_choice == 1:
-            iterations = await prompt_input_async("How many iterations?", "10")
-            if project_dir:
-                os.chdir(project_dir)
-                # Use async version since we're already in an event loop
-                return await _run_loop_agent_async(project_dir, int(iterations), loop_type="default", start_iteration=1)
+
+            # Use async prompt since we're in async context
+            next_choice = await prompt_choice_async(
+                "What would you like to do next?",
+                [
+                    "Continue refining",
+                    "Start the coding loop",
+                    "Exit (save for later)"
+                ]
+            )
+
+            if next_choice == 0:
+                continue
+            elif next_choice == 1:
+                iterations = await prompt_input_async("How many iterations?", "10")
+                if project_dir:
+                    os.chdir(project_dir)
+                    # Use async version since we're already in an event loop
+                    return await _run_loop_agent_async(project_dir, int(iterations), loop_type="default", start_iteration=1)
+                else:
+                    print_info("To start loop: ralph run <project> -n " + iterations)
+                    return 0
             else:
-                print_info("To start loop: ralph run <project> -n " + iterations)
+                spec_file = workspace_dir / "spec-session.md"
+                print_info(f"Spec saved to: {spec_file}")
                 return 0
-        else:
-            spec_file = workspace_dir / "spec-session.md"
-            print_info(f"Spec saved to: {spec_file}")
-            return 0
-            
+
     except Exception as e:
         print_error(f"Error during refinement: {e}")
         traceback.print_exc()
@@ -1395,6 +1614,43 @@ def cmd_init(args):
     return 0
 
 
+def _format_list_entry(proj: dict) -> str:
+    """Do the per-project filesystem probing and formatting for cmd_list.
+
+    Kept free of shared state so the entries can be gathered on a
+    thread pool - each one blocks on its own stat/read syscalls.
+    """
+    project_path = Path(proj["path"])
+    project_name = proj["name"]
+
+    # Check if project still exists
+    if not project_path.exists():
+        return (
+            f"  {Colors.DIM}{project_name} (missing){Colors.NC}\n"
+            f"    {Colors.DIM}Path: {project_path}{Colors.NC}\n\n"
+        )
+
+    progress_path = project_path / "progress.txt"
+
+    created = proj.get("registered", "Unknown")[:10]  # Just date part
+    last_run = proj.get("last_run")
+
+    progress_count = 0
+    if progress_path.exists():
+        progress_count = _count_progress_entries(progress_path)
+
+    lines = [
+        f"  {Colors.BOLD}{project_name}{Colors.NC}",
+        f"    Path: {Colors.CYAN}{project_path}{Colors.NC}",
+        f"    Created: {created}",
+    ]
+    if last_run:
+        lines.append(f"    Last run: {last_run[:10]}")  # Just date part
+    lines.append(f"    Progress entries: {progress_count}")
+    lines.append("\n")
+    return "\n".join(lines)
+
+
 def cmd_list(args):
     """List all registered Ralph projects."""
     projects = get_all_projects()
@@ -1408,38 +1664,16 @@ def cmd_list(args):
     print_header("Ralph Projects")
     print()
 
-    for proj in projects:
-        project_path = Path(proj["path"])
-        project_name = proj["name"]
-        
-        # Check if project still exists
-        if not project_path.exists():
-            print(f"  {Colors.DIM}{project_name} (missing){Colors.NC}")
-            print(f"    {Colors.DIM}Path: {project_path}{Colors.NC}")
-            print()
-            continue
-        
-        config_path = project_path / ".ralph-config"
-        progress_path = project_path / "progress.txt"
-
-        created = proj.get("registered", "Unknown")[:10]  # Just date part
-        last_run = proj.get("last_run")
-        if last_run:
-            last_run = last_run[:10]  # Just date part
-
-        progress_count = 0
-        if progress_path.exists():
-            progress_count = len(
-                [l for l in progress_path.read_text().splitlines() if l.strip() and not l.startswith("#")]
-            )
+    # The per-project work is all blocking filesystem I/O; overlap it
+    # on a thread pool (map preserves registry order) and emit the
+    # whole listing in one write
+    if len(projects) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, 4 * (os.cpu_count() or 1))) as ex:
+            entries = list(ex.map(_format_list_entry, projects))
+    else:
+        entries = [_format_list_entry(projects[0])]
 
-        print(f"  {Colors.BOLD}{project_name}{Colors.NC}")
-        print(f"    Path: {Colors.CYAN}{project_path}{Colors.NC}")
-        print(f"    Created: {created}")
-        if last_run:
-            print(f"    Last run: {last_run}")
-        print(f"    Progress entries: {progress_count}")
-        print()
+    sys.stdout.write("".join(entries))
 
     return 0
 
@@ -1515,9 +1749,9 @@ def cmd_run(args):
             print_info("Migrating PRD.json to Ralph workspace...")
             workspace_dir.mkdir(parents=True, exist_ok=True)
             if (target_dir / "PRD.json").exists():
-                shutil.copy(target_dir / "PRD.json", workspace_dir / "PRD.json")
+                _fast_copy(target_dir / "PRD.json", workspace_dir / "PRD.json")
             if (target_dir / "progress.txt").exists():
-                shutil.copy(target_dir / "progress.txt", workspace_dir / "progress.txt")
+                _fast_copy(target_dir / "progress.txt", workspace_dir / "progress.txt")
 
     # Docker sandbox mode
     if getattr(args, 'docker', False):
@@ -1542,28 +1776,30 @@ def cmd_run(args):
     start_iteration = 1
     
     if resume and saved_state and saved_state.get("status") == "paused":
-        # Resume from saved state
+        # Resume from saved state; read the fields into locals once
         start_iteration = saved_state.get("iteration", 1)
         iterations = saved_state.get("total_iterations", args.iterations or 10)
         loop_type = saved_state.get("loop_type", loop_type)
-        
+        task_id = saved_state.get("current_task_id", "")
+        task_desc = saved_state.get("current_task", "")
+
         print_header(f"Resuming AFK Loop")
         print_info(f"Resuming from iteration {start_iteration}/{iterations}")
-        if saved_state.get("current_task"):
-            task_id = saved_state.get("current_task_id", "")
-            task_desc = saved_state.get("current_task", "")
+        if task_desc:
             if task_id:
                 print_info(f"Last task: [{task_id}] {task_desc}")
             else:
                 print_info(f"Last task: {task_desc}")
         print()
-        
+
     elif saved_state and saved_state.get("status") == "paused" and not resume:
         # Has saved state but --resume not specified
-        print_info(f"Found paused loop at iteration {saved_state.get('iteration')}/{saved_state.get('total_iterations')}")
+        saved_iteration = saved_state.get("iteration", 1)
+        saved_total = saved_state.get("total_iterations", args.iterations or 10)
+        print_info(f"Found paused loop at iteration {saved_iteration}/{saved_total}")
         if prompt_confirm("Resume from where you left off?"):
-            start_iteration = saved_state.get("iteration", 1)
-            iterations = saved_state.get("total_iterations", args.iterations or 10)
+            start_iteration = saved_iteration
+            iterations = saved_total
             loop_type = saved_state.get("loop_type", loop_type)
             print_header(f"Resuming AFK Loop")
         else:
@@ -1656,8 +1892,6 @@ def cmd_spec(args):
 
 def cmd_status(args):
     """Show status of a project from its workspace."""
-    import json
-    
     target_dir = resolve_project_path(args.project)
     project_name = getattr(args, 'project_name', None)
     target_name = target_dir.name
@@ -1680,19 +1914,17 @@ def cmd_status(args):
     prd_path = workspace_dir / "PRD.json"
     if prd_path.exists():
         try:
-            prd = json.loads(prd_path.read_text())
+            prd = _load_prd(prd_path)
             tasks = prd.get("tasks", [])
             total_tasks = len(tasks)
-            done_tasks = sum(1 for t in tasks if t.get("status") == "done")
+            done_tasks, next_task = _scan_tasks(tasks)
             
             print(f"{Colors.BOLD}PRD Tasks:{Colors.NC}")
             print(f"  {done_tasks}/{total_tasks} complete")
             
             # Show next incomplete task
-            for task in sorted(tasks, key=lambda t: t.get("priority", 999)):
-                if task.get("status") != "done":
-                    print(f"  Next: [{task.get('id', '?')}] {task.get('name', 'Unknown')}")
-                    break
+            if next_task is not None:
+                print(f"  Next: [{next_task.get('id', '?')}] {next_task.get('name', 'Unknown')}")
             print()
         except Exception:
             pass
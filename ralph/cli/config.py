@@ -1,6 +1,7 @@
 """Project-level configuration for Ralph."""
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
@@ -55,6 +56,58 @@ def load_project_config() -> dict[str, Any]:
             
     return config
 
+@dataclass(frozen=True, slots=True)
+class LoopConfig:
+    """The settings the agent runners actually consume, read once.
+
+    A frozen slots dataclass instead of the raw config dict: field
+    access is a fixed-offset load rather than a hash lookup, and the
+    per-site .get() defaults (which load_project_config already fills
+    in) disappear.
+    """
+    spec_model: str
+    loop_model: str
+    context_limit: int
+    rotate_threshold: float
+    auto_gutter: bool
+    plan_messages_limit: int
+
+
+# (settings.json mtime_ns, LoopConfig) - same mtime-keyed invalidation
+# as the PRD cache: save_project_config bumps the mtime, so edits made
+# through the settings menu are picked up on the next read.
+_LOOP_CONFIG_CACHE: Optional[tuple[int, LoopConfig]] = None
+
+
+def get_loop_config() -> LoopConfig:
+    """Load the agent-runner settings, memoized on the config file mtime.
+
+    Returns:
+        LoopConfig with the effective (user or default) values
+    """
+    global _LOOP_CONFIG_CACHE
+    try:
+        mtime = get_global_config_path().stat().st_mtime_ns
+    except OSError:
+        mtime = -1
+
+    cached = _LOOP_CONFIG_CACHE
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = load_project_config()
+    loop_config = LoopConfig(
+        spec_model=config["spec_model"],
+        loop_model=config["loop_model"],
+        context_limit=config["context_limit"],
+        rotate_threshold=config["rotate_threshold"],
+        auto_gutter=config["auto_gutter"],
+        plan_messages_limit=config["plan_messages_limit"],
+    )
+    _LOOP_CONFIG_CACHE = (mtime, loop_config)
+    return loop_config
+
+
 def save_project_config(config: dict[str, Any]) -> None:
     """Save configuration to settings.json in the Ralph folder.
     
@@ -6,6 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from .._json import loads as _json_loads
+
 
 def get_ralph_root() -> Path:
     """Get the root directory of the ralph-autocoder installation.
@@ -347,36 +349,50 @@ def list_workspace_projects(target_path: Path) -> list[dict]:
     """
     workspace_root = get_workspaces_root(target_path)
     active_project = get_active_project(target_path)
-    
+
+    # One scandir for the project dirs and one per project for its
+    # files, instead of separate stat probes for each file of interest
+    try:
+        with os.scandir(workspace_root) as it:
+            entries = sorted(
+                (e for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")),
+                key=lambda e: e.name,
+            )
+    except OSError:
+        return []
+
     projects = []
-    for item in sorted(workspace_root.iterdir()):
-        if item.is_dir() and not item.name.startswith("."):
-            prd_path = item / "PRD.json"
-            progress_path = item / "progress.txt"
-            
-            # Count tasks if PRD exists
-            total_tasks = 0
-            done_tasks = 0
-            if prd_path.exists():
-                try:
-                    import json
-                    prd = json.loads(prd_path.read_text())
-                    tasks = prd.get("tasks", [])
-                    total_tasks = len(tasks)
-                    done_tasks = sum(1 for t in tasks if t.get("status") == "done")
-                except Exception:
-                    pass
-            
-            projects.append({
-                "name": item.name,
-                "path": str(item),
-                "is_active": item.name == active_project,
-                "has_prd": prd_path.exists(),
-                "has_progress": progress_path.exists(),
-                "total_tasks": total_tasks,
-                "done_tasks": done_tasks,
-            })
-    
+    for entry in entries:
+        try:
+            with os.scandir(entry.path) as it:
+                names = {f.name for f in it}
+        except OSError:
+            names = set()
+
+        has_prd = "PRD.json" in names
+
+        # Count tasks if PRD exists
+        total_tasks = 0
+        done_tasks = 0
+        if has_prd:
+            try:
+                prd = _json_loads(Path(entry.path, "PRD.json").read_bytes())
+                tasks = prd.get("tasks", [])
+                total_tasks = len(tasks)
+                done_tasks = sum(1 for t in tasks if t.get("status") == "done")
+            except Exception:
+                pass
+
+        projects.append({
+            "name": entry.name,
+            "path": entry.path,
+            "is_active": entry.name == active_project,
+            "has_prd": has_prd,
+            "has_progress": "progress.txt" in names,
+            "total_tasks": total_tasks,
+            "done_tasks": done_tasks,
+        })
+
     return projects
 
 
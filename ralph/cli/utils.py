@@ -1,10 +1,12 @@
 """Utility functions and helpers for Ralph CLI."""
 
 import asyncio
+import io
 import os
 import sys
 import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import questionary
@@ -39,6 +41,82 @@ def print_separator():
     print(f"{Colors.DIM}{'─' * 56}{Colors.NC}")
 
 
+_stdout_batched = False
+
+
+@contextmanager
+def batched_stdout():
+    """Buffer stdout for the duration of a print-heavy flow.
+
+    On a line-buffered TTY every print() is its own write syscall; the
+    start flow emits dozens of tiny lines. Inside this context they
+    accumulate in an 8 KiB buffer instead. The prompt helpers flush
+    before handing the terminal to questionary, so all preceding output
+    is visible whenever a prompt appears. Re-entrant: nested uses are
+    no-ops.
+    """
+    global _stdout_batched
+    orig = sys.stdout
+    if _stdout_batched or not hasattr(orig, "buffer"):
+        yield
+        return
+
+    buffered = io.TextIOWrapper(
+        io.BufferedWriter(orig.buffer, buffer_size=8192),
+        encoding=orig.encoding,
+        errors=getattr(orig, "errors", None) or "strict",
+        line_buffering=False,
+        write_through=False,
+    )
+    sys.stdout = buffered
+    _stdout_batched = True
+    try:
+        yield
+    finally:
+        _stdout_batched = False
+        sys.stdout = orig
+        try:
+            buffered.flush()
+        finally:
+            # Detach both wrapper layers so GC never closes the real
+            # stdout underneath us
+            buffered.detach().detach()
+
+
+class StreamWriter:
+    """Batches streamed chunk output into fewer stdout writes.
+
+    The spec conversation printed every streamed chunk with
+    print(..., flush=True) - one write syscall per chunk, which
+    dominates latency on slow TTYs. Chunks accumulate here and are
+    written in one go at ~4 KiB or at explicit boundaries (end of a
+    response, before a prompt or spinner takes the terminal).
+
+    Buffering happens at the text layer via sys.stdout.write rather
+    than raw os.write on the fd, so it can never reorder against the
+    print()-based output around it.
+    """
+
+    _FLUSH_AT = 4096
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._FLUSH_AT:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            sys.stdout.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        sys.stdout.flush()
+
+
 class ThinkingSpinner:
     """A spinner that shows while Claude is thinking.
     
@@ -211,22 +289,36 @@ def sanitize_project_name(name: str) -> str:
     return "".join(c if c.isalnum() or c == "-" else "-" for c in name.lower()).strip("-")
 
 
+# Static prompt configuration shared by every select/text prompt.
+# questionary Questions are single-use (each ask() needs a fresh
+# prompt_toolkit Application), so the reusable part is this config,
+# built once instead of per call.
+_SELECT_KWARGS = {
+    "style": PROMPT_STYLE,
+    "qmark": "›",
+    "instruction": "(↑↓ to move, enter to select, ctrl+c to cancel)",
+    "use_shortcuts": False,
+}
+_TEXT_KWARGS = {
+    "style": PROMPT_STYLE,
+    "qmark": "›",
+}
+
+
 def prompt_choice(prompt: str, choices: list[str], default: int = 0) -> int:
     """Prompt user to choose from a list of options.
-    
+
     Use arrow keys to navigate, Enter to select, Ctrl+C to exit.
     Returns the index of the selected choice.
     """
     print()
     print_separator()
+    sys.stdout.flush()  # deliver buffered output before the prompt
     result = questionary.select(
         prompt,
         choices=choices,
         default=choices[default] if 0 <= default < len(choices) else choices[0],
-        style=PROMPT_STYLE,
-        qmark="›",
-        instruction="(↑↓ to move, enter to select, ctrl+c to cancel)",
-        use_shortcuts=False,
+        **_SELECT_KWARGS,
     ).ask()
     
     if result is None:
@@ -244,14 +336,12 @@ async def prompt_choice_async(prompt: str, choices: list[str], default: int = 0)
     """
     print()
     print_separator()
+    sys.stdout.flush()  # deliver buffered output before the prompt
     result = await questionary.select(
         prompt,
         choices=choices,
         default=choices[default] if 0 <= default < len(choices) else choices[0],
-        style=PROMPT_STYLE,
-        qmark="›",
-        instruction="(↑↓ to move, enter to select, ctrl+c to cancel)",
-        use_shortcuts=False,
+        **_SELECT_KWARGS,
     ).ask_async()
     
     if result is None:
@@ -268,11 +358,11 @@ def prompt_input(prompt: str, default: str = "") -> str:
     """
     print()
     print_separator()
+    sys.stdout.flush()  # deliver buffered output before the prompt
     result = questionary.text(
         prompt,
         default=default,
-        style=PROMPT_STYLE,
-        qmark="›",
+        **_TEXT_KWARGS,
     ).ask()
     
     if result is None:
@@ -289,11 +379,11 @@ async def prompt_input_async(prompt: str, default: str = "") -> str:
     """
     print()
     print_separator()
+    sys.stdout.flush()  # deliver buffered output before the prompt
     result = await questionary.text(
         prompt,
         default=default,
-        style=PROMPT_STYLE,
-        qmark="›",
+        **_TEXT_KWARGS,
     ).ask_async()
     
     if result is None:
@@ -310,6 +400,7 @@ def prompt_confirm(prompt: str, default: bool = True) -> bool:
     """
     print()
     print_separator()
+    sys.stdout.flush()  # deliver buffered output before the prompt
     result = questionary.confirm(
         prompt,
         default=default,